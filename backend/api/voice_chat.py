@@ -584,14 +584,16 @@
 
 # surgicalcompanian/backend/api/voice_chat.py
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel # Used for ChatResponse, ConverseRequest
 from typing import Optional, List, Dict, Any
 from datetime import datetime
+import asyncio
 import logging
 import os
 
 # Import shared services from the backend/services directory
-from backend.services.database_manager import DatabaseManager # Corrected path
+from backend.services.database_manager import get_database_manager
 from backend.services.orchestrator import ConversationOrchestrator # Corrected path
 # from backend.services.llm_client import LLMClient # Not directly used here, Orchestrator uses it
 # from backend.services.prompt_generator import PromptGenerator # Not directly used here, Orchestrator uses it
@@ -613,7 +615,7 @@ router = APIRouter()
 # To simplify initial integration, we'll create new instances here.
 # In production, these should ideally be singletons managed by FastAPI's dependency injection
 # or startup events in main.py for efficiency.
-db_manager = DatabaseManager()
+db_manager = get_database_manager() # Shared with main.py, which closes its pool on shutdown
 orchestrator = ConversationOrchestrator()
 logger = logging.getLogger(__name__)
 
@@ -625,9 +627,15 @@ async def converse(request: ConverseRequest):
     Handles the core conversational logic and state management.
     """
     try:
+        # DB reads/writes and the Gemini calls below are blocking, so they run in the
+        # threadpool to keep the event loop free for other conversations
+
         # 1. Fetch Patient and Call Session Data using the shared db_manager
-        patient_data = db_manager.get_patient_data(request.patient_id)
-        call_session_data = db_manager.get_call_session_data(request.call_session_id)
+        # (independent reads on separate pooled connections, so they run concurrently)
+        patient_data, call_session_data = await asyncio.gather(
+            run_in_threadpool(db_manager.get_patient_data, request.patient_id),
+            run_in_threadpool(db_manager.get_call_session_data, request.call_session_id),
+        )
 
         if not patient_data:
             raise HTTPException(status_code=404, detail="Patient not found")
@@ -636,7 +644,8 @@ async def converse(request: ConverseRequest):
 
         # 2. Let the Orchestrator determine the next step and response
         # Orchestrator handles NLU, LLM calls, and state updates based on your design
-        agent_response_info = orchestrator.get_next_agent_response(
+        agent_response_info = await run_in_threadpool(
+            orchestrator.get_next_agent_response,
             patient_data, call_session_data, request.message # request.message is the user's input
         )
 
@@ -644,22 +653,23 @@ async def converse(request: ConverseRequest):
         # Note: conversation_history, call_status, actual_call_start, call_duration_seconds
         # are updated by orchestrator logic and returned in agent_response_info
         
-        db_manager.update_call_session(
+        # Call session state and the patient's report (previous data + new data)
+        # are written in one transaction
+        updated_clinical_data = agent_response_info.get("updated_clinical_data")
+        await run_in_threadpool(
+            db_manager.save_turn,
             request.call_session_id,
             {
                 "conversation_history": agent_response_info["updated_conversation_history"],
                 "call_status": agent_response_info["new_call_status"],
                 "actual_call_start": agent_response_info["actual_call_start"],
                 "call_duration_seconds": agent_response_info["call_duration_seconds"]
-            }
-        )
-        # 6. Update patient's clinical data record
-        # Use the full agent response which includes previous data + new data
-        if agent_response_info.get("updated_clinical_data"):
-            db_manager.update_patient_report(
-            request.patient_id, agent_response_info["updated_clinical_data"]
+            },
+            patient_id=request.patient_id,
+            new_report_json=updated_clinical_data,
         )
-            logger.info(f"Updated clinical data for patient {request.patient_id}")
+        if updated_clinical_data:
+            logger.info("Updated clinical data for patient %s", request.patient_id)
 
         return ChatResponse(
             response=agent_response_info["response_text"],
@@ -17,7 +17,7 @@ import os # Added for os.getenv in startup
 sys.path.append(str(Path(__file__).parent.parent))
 
 # Import shared services from the new common services location
-from backend.services.database_manager import DatabaseManager
+from backend.services.database_manager import DatabaseManager, get_database_manager
 from backend.services.llm_client import LLMClient
 from backend.services.orchestrator import ConversationOrchestrator
 from backend.services.prompt_generator import PromptGenerator
@@ -74,12 +74,13 @@ async def startup_event():
     
     # Initialize Database Manager
     try:
-        db_manager = DatabaseManager()
+        # Same instance the routers use, so shutdown closes the one shared pool
+        db_manager = get_database_manager()
         # Optional: Test DB connection here
         # For simple test: db_manager._get_connection().close()
         logger.info("DatabaseManager initialized successfully.")
     except Exception as e:
-        logger.error(f"Failed to initialize DatabaseManager: {e}")
+        logger.error("Failed to initialize DatabaseManager: %s", e)
         raise # Critical failure, stop startup
 
     # Initialize LLM Client
@@ -92,7 +93,7 @@ async def startup_event():
         llm_client = LLMClient(api_key)
         logger.info("LLMClient initialized successfully.")
     except Exception as e:
-        logger.error(f"Failed to initialize LLMClient: {e}")
+        logger.error("Failed to initialize LLMClient: %s", e)
         raise # Critical failure, stop startup
 
     # Initialize Prompt Generator
@@ -119,7 +120,9 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on application shutdown."""
     logger.info("Shutting down TKA Voice Agent API...")
-    # Add any cleanup like closing DB connections if using a pool (not direct conn per request)
+    # Close pooled DB connections
+    if db_manager is not None:
+        db_manager.close()
 
 
 # Include API routers
@@ -165,7 +168,7 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception): # Type hints for clarity
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True) # exc_info=True to log traceback
+    logger.error("Unhandled exception: %s", exc, exc_info=True) # exc_info=True to log traceback
     return JSONResponse(
         status_code=500,
         content={
@@ -4,14 +4,28 @@ Manages call contexts for different stages of patient care.
 Provides context injection for AI conversations based on call type and patient data.
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import threading
+from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
 # Remove or stub out model imports, use direct imports for any remaining modules.
 
 
+# Patient fields a call context is built from; editing any of them must
+# produce a new context rather than the cached one
+_PATIENT_CONTEXT_FIELDS = (
+    "first_name",
+    "last_name",
+    "surgery_date",
+    "primary_phone",
+    "overall_compliance_score",
+    "surgery_readiness_status",
+)
+
+
 class CallType(Enum):
     """Enum for different call types"""
     INITIAL_CLINICAL_ASSESSMENT = "initial_clinical_assessment"
@@ -20,9 +34,9 @@ class CallType(Enum):
     FINAL_LOGISTICS = "final_logistics"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CallContext:
-    """Complete context for a patient call"""
+    """Complete context for a patient call; built once and read on every prompt render"""
     call_type: CallType
     days_from_surgery: int
     patient_data: Dict[str, Any]
@@ -31,6 +45,7 @@ class CallContext:
     escalation_triggers: List[str]
     tone: str
     estimated_duration_minutes: int
+    surgery_date_str: str = ""  # Display form, e.g. "March 05, 2025"; formatted once at construction
 
 
 @dataclass
@@ -46,8 +61,14 @@ class ConversationSection:
 class CallContextService:
     """Service for managing call contexts and conversation flows"""
     
+    # Upper bound on cached call contexts (reconnects / retries of recent calls)
+    CONTEXT_CACHE_SIZE = 256
+    
     def __init__(self):
         self.call_definitions = self._initialize_call_definitions()
+        self._context_cache: "OrderedDict[Tuple, CallContext]" = OrderedDict()
+        # Requests run on a threadpool, and OrderedDict reordering is not thread-safe
+        self._cache_lock = threading.Lock()
     
     def _initialize_call_definitions(self) -> Dict[CallType, Dict[str, Any]]:
         """Initialize call type definitions"""
@@ -95,13 +116,51 @@ class CallContextService:
         }
     
     def get_call_context(self, patient: Any, call_session: Any) -> CallContext:
-        """Generate complete call context for a patient call"""
+        """Generate complete call context for a patient call.
+        
+        Contexts are cached per (patient, call session, the values they are built
+        from, day) so a reconnect or retry of the same call reuses the one already
+        built, while an edited patient record builds a new one. The day is part of
+        the key, and the same day is used to compute days_until_surgery, so a
+        cached context never carries another day's count.
+        """
+        
+        today = date.today()
+        cache_key = (
+            str(patient['id']),
+            str(call_session.get('id')),
+            call_session.get('call_type'),
+            call_session.get('days_from_surgery'),
+            tuple(patient.get(field) for field in _PATIENT_CONTEXT_FIELDS),
+            today,
+        )
+        with self._cache_lock:
+            cached = self._context_cache.get(cache_key)
+            if cached is not None:
+                self._context_cache.move_to_end(cache_key)
+                return cached
+        
+        context = self._build_call_context(patient, call_session, today)
+        with self._cache_lock:
+            self._context_cache[cache_key] = context
+            if len(self._context_cache) > self.CONTEXT_CACHE_SIZE:
+                self._context_cache.popitem(last=False)
+        return context
+    
+    def invalidate_call_context(self, patient_id: Any, call_session_id: Any) -> None:
+        """Drop cached contexts for a call, e.g. when it ends or its data changes"""
+        with self._cache_lock:
+            for key in [key for key in self._context_cache if key[:2] == (str(patient_id), str(call_session_id))]:
+                del self._context_cache[key]
+    
+    def _build_call_context(self, patient: Any, call_session: Any, today: date) -> CallContext:
+        """Build a call context from scratch as of the given day"""
         
         call_type = CallType(call_session['call_type'])
         call_definition = self.call_definitions[call_type]
         
         # Build patient data context
-        patient_data = self._build_patient_context(patient, call_session)
+        patient_data = self._build_patient_context(patient, call_session, today)
         
         # Build conversation structure
         days_from_surgery = getattr(call_session, "days_from_surgery", 0)
@@ -115,14 +174,17 @@ class CallContextService:
             focus_areas=call_definition["sections"],
             escalation_triggers=call_definition["escalation_triggers"],
             tone=call_definition["tone"],
-            estimated_duration_minutes=call_definition["duration_minutes"]
+            estimated_duration_minutes=call_definition["duration_minutes"],
+            surgery_date_str=patient["surgery_date"].strftime('%B %d, %Y')
         )
     
-    def _build_patient_context(self, patient: Any, call_session: Any) -> Dict[str, Any]:
+    def _build_patient_context(self, patient: Any, call_session: Any, today: date) -> Dict[str, Any]:
         """Build patient-specific context data"""
         
-        # Calculate surgery timing
-        days_until_surgery = (patient["surgery_date"] - datetime.now()).days
+        # Calculate surgery timing in whole calendar days from today
+        surgery_date = patient["surgery_date"]
+        surgery_day = surgery_date.date() if isinstance(surgery_date, datetime) else surgery_date
+        days_until_surgery = (surgery_day - today).days
         
         return {
             "patient_id": str(patient['id']),
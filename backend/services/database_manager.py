@@ -1,16 +1,49 @@
 # surgicalcompanian/backend/services/database_manager.py
 import psycopg2
+import psycopg2.extensions
+from psycopg2 import pool, sql
+from psycopg2.extras import Json
 from psycopg2.errors import ConnectionFailure
 import os
 import datetime
 import uuid
 import json
+import functools
 import logging
+import threading
+from contextlib import contextmanager
 from urllib.parse import urlparse # ADDED: for parsing DATABASE_URL
 from typing import Optional # ADDED: for type hinting
 
 logger = logging.getLogger(__name__)
 
+# Hot-path reads, prepared once per physical connection so Postgres skips
+# parse/plan on every execute
+_PREPARED_STATEMENTS = (
+    "PREPARE sc_get_patient(uuid) AS "
+    "SELECT id, first_name, last_name, surgery_date, report FROM patients WHERE id = $1",
+    "PREPARE sc_get_call_session(uuid) AS "
+    "SELECT id, patient_id, call_status, actual_call_start, conversation_history, call_type, call_duration_seconds "
+    "FROM call_sessions WHERE id = $1",
+)
+
+# Conversation histories and reports are written every turn; compact separators
+# keep the serialized jsonb parameter smaller than json.dumps' default spacing
+_compact_dumps = functools.partial(json.dumps, separators=(",", ":"))
+
+
+def _jsonb(value) -> Json:
+    """Adapts a dict/list for a jsonb column."""
+    return Json(value, dumps=_compact_dumps)
+
+
+class _PooledConnection(psycopg2.extensions.connection):
+    """Connection that remembers whether _PREPARED_STATEMENTS ran on it, and
+    the pool it was checked out from."""
+    statements_prepared = False
+    source_pool = None
+
+
 class DatabaseManager:
     def __init__(self):
         # Database connection parameters from environment variables
@@ -32,30 +65,98 @@ class DatabaseManager:
         if not all([self.conn_params["database"], self.conn_params["user"], self.conn_params["password"], self.conn_params["host"]]):
             raise ValueError("Incomplete DATABASE_URL provided. Check components.")
         
-        print("DB_MANAGER_INIT: DatabaseManager instance initialized.")
-        print(f"DB_MANAGER_INIT: Connecting to DB: {self.conn_params['host']}:{self.conn_params['port']}/{self.conn_params['database']} as {self.conn_params['user']}")
+        # Connections are pooled and reused across requests instead of opening a
+        # new TCP/TLS session per query. The pool is created on first use so that
+        # constructing the manager (e.g. at import time) never touches the DB.
+        # Every request thread holds at most one connection at a time, so the
+        # default matches the 40 worker threads of FastAPI's run_in_threadpool.
+        self.pool_min = int(os.getenv("DB_POOL_MIN", "2"))
+        self.pool_max = int(os.getenv("DB_POOL_MAX", "40"))
+        self._pool: Optional[pool.ThreadedConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # ThreadedConnectionPool raises PoolError when exhausted instead of
+        # waiting, so checkouts queue on this semaphore first
+        self._pool_slots = threading.BoundedSemaphore(self.pool_max)
+        self.pool_timeout = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+        
+        logger.info("DB_MANAGER_INIT: DatabaseManager initialized for %s:%s/%s as %s", self.conn_params['host'],
+                    self.conn_params['port'], self.conn_params['database'], self.conn_params['user'])
+
+    def _get_pool(self) -> pool.ThreadedConnectionPool:
+        """Returns the shared connection pool, creating it on first use."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = pool.ThreadedConnectionPool(
+                        minconn=self.pool_min, maxconn=self.pool_max,
+                        connection_factory=_PooledConnection, **self.conn_params
+                    )
+        return self._pool
                             
     def _get_connection(self):
-        """Establishes and returns a new database connection."""
-        print("DB_MANAGER: Attempting to get DB connection...")
+        """Checks out a database connection from the pool, preparing the hot-path
+        statements the first time a physical connection is handed out. Waits up to
+        pool_timeout seconds for a connection when all of them are in use."""
+        if not self._pool_slots.acquire(timeout=self.pool_timeout):
+            logger.error("DB_MANAGER: ERROR - no pooled connection free after %ss", self.pool_timeout)
+            raise ConnectionFailure(f"No database connection available after {self.pool_timeout}s")
+        conn = None
         try:
-            conn = psycopg2.connect(**self.conn_params)
-            print("DB_MANAGER: Successfully got DB connection.")
+            conn_pool = self._get_pool()
+            conn = conn_pool.getconn()
+            conn.source_pool = conn_pool
+            if not conn.statements_prepared:
+                with conn.cursor() as cur:
+                    for statement in _PREPARED_STATEMENTS:
+                        cur.execute(statement)
+                conn.commit()
+                conn.statements_prepared = True
             return conn
         except psycopg2.Error as e:
-            print(f"DB_MANAGER: ERROR - getting DB connection: {e}")
+            if conn is not None:
+                # Don't leak the checked-out connection; it may be unusable
+                conn.source_pool.putconn(conn, close=True)
+            self._pool_slots.release()
+            logger.error("DB_MANAGER: ERROR - getting DB connection: %s", e)
             raise ConnectionFailure(f"PostgreSQL connection failed: {e}")
+        except BaseException:
+            self._pool_slots.release()
+            raise
+
+    def _put_connection(self, conn):
+        """Returns a connection to the pool; broken connections are discarded.
+        The pool rolls back any transaction left open (e.g. by a SELECT). A
+        connection checked out before close() is closed instead, since its pool
+        is gone."""
+        try:
+            if conn.source_pool is self._pool:
+                conn.source_pool.putconn(conn, close=bool(conn.closed))
+            else:
+                conn.close()
+        finally:
+            self._pool_slots.release()
+
+    @contextmanager
+    def _conn(self):
+        """Yields a pooled connection and always hands it back."""
+        conn = self._get_connection()
+        try:
+            yield conn
+        finally:
+            self._put_connection(conn)
+
+    def close(self):
+        """Closes every pooled connection (call on application shutdown)."""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
 
     def get_patient_data(self, patient_id: str):
-        conn = None
         try:
-            conn = self._get_connection()
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT id, first_name, last_name, surgery_date, report FROM patients WHERE id = %s;",
-                (patient_id,)
-            )
-            record = cur.fetchone()
+            with self._conn() as conn:
+                cur = conn.cursor()
+                cur.execute("EXECUTE sc_get_patient(%s);", (patient_id,))
+                record = cur.fetchone()
             if record:
                 return {
                     "id": str(record[0]),
@@ -66,21 +167,15 @@ class DatabaseManager:
                 }
             return None
         except psycopg2.Error as e:
-            print(f"Error fetching patient data for ID {patient_id}: {e}")
+            logger.error("Error fetching patient data for ID %s: %s", patient_id, e)
             raise
-        finally:
-            if conn: conn.close()
 
     def get_call_session_data(self, call_session_id: str):
-        conn = None
         try:
-            conn = self._get_connection()
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT id, patient_id, call_status, actual_call_start, conversation_history, call_type, call_duration_seconds FROM call_sessions WHERE id = %s;",
-                (call_session_id,)
-            )
-            record = cur.fetchone()
+            with self._conn() as conn:
+                cur = conn.cursor()
+                cur.execute("EXECUTE sc_get_call_session(%s);", (call_session_id,))
+                record = cur.fetchone()
             if record:
                 # Parse conversation_history properly
                 conversation_history = record[4]
@@ -103,61 +198,69 @@ class DatabaseManager:
                 }
             return None
         except psycopg2.Error as e:
-            print(f"Error fetching call session data for ID {call_session_id}: {e}")
+            logger.error("Error fetching call session data for ID %s: %s", call_session_id, e)
             raise
-        finally:
-            if conn: conn.close()
+
+    @staticmethod
+    def _call_session_update(call_session_id: str, updates: dict):
+        """Builds the UPDATE for call_sessions with quoted column identifiers."""
+        statement = sql.SQL("UPDATE call_sessions SET {assignments}, updated_at = NOW() WHERE id = %s").format(
+            assignments=sql.SQL(", ").join(
+                sql.SQL("{} = %s").format(sql.Identifier(key)) for key in updates
+            )
+        )
+        values = [_jsonb(val) if isinstance(val, (dict, list)) else val for val in updates.values()]
+        values.append(call_session_id)
+        return statement, tuple(values)
 
     def update_call_session(self, call_session_id: str, updates: dict):
-        conn = None
-        try:
-            conn = self._get_connection()
-            cur = conn.cursor()
-            
-            set_clauses = []
-            values = []
-            for key, val in updates.items():
-                set_clauses.append(f"{key} = %s")
-                if isinstance(val, (dict, list)):
-                    values.append(json.dumps(val))
-                    set_clauses[-1] += "::jsonb"
-                else:
-                    values.append(val)
-            
-            values.append(call_session_id)
-            
-            sql = f"UPDATE call_sessions SET {', '.join(set_clauses)}, updated_at = NOW() WHERE id = %s;"
-            cur.execute(sql, tuple(values))
-            conn.commit()
-        except psycopg2.Error as e:
-            print(f"Error updating call session {call_session_id}: {e}")
-            if conn: conn.rollback()
-            raise
-        finally:
-            if conn: conn.close()
+        self.save_turn(call_session_id, updates)
 
     def update_patient_report(self, patient_id: str, new_report_json: dict):
         """
         Updates a patient's report data in the database.
         """
-        conn = None
-        try:
-            conn = self._get_connection()
-            with conn.cursor() as cur:
-                cur.execute(
-                    "UPDATE patients SET report = %s::jsonb, updated_at = NOW() WHERE id = %s;",
-                    (json.dumps(new_report_json), patient_id)
-                )
-            conn.commit()
-            logger.info(f"Successfully updated report for patient {patient_id}")
-        except Exception as e:
-            if conn:
+        with self._conn() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "UPDATE patients SET report = %s, updated_at = NOW() WHERE id = %s;",
+                        (_jsonb(new_report_json), patient_id)
+                    )
+                conn.commit()
+                logger.info("Successfully updated report for patient %s", patient_id)
+            except Exception as e:
                 conn.rollback()
-            logger.error(f"Error updating report for patient {patient_id}: {e}")
-            raise
-        finally:
-            if conn:
-                conn.close()
-            
+                logger.error("Error updating report for patient %s: %s", patient_id, e)
+                raise
+
+    def save_turn(self, call_session_id: str, updates: dict,
+                  patient_id: Optional[str] = None, new_report_json: Optional[dict] = None):
+        """
+        Writes a conversation turn's call session changes, and optionally the
+        patient's report, in a single transaction with one COMMIT.
+        """
+        with self._conn() as conn:
+            try:
+                with conn.cursor() as cur:
+                    if updates:
+                        cur.execute(*self._call_session_update(call_session_id, updates))
+                    if patient_id and new_report_json:
+                        cur.execute(
+                            "UPDATE patients SET report = %s, updated_at = NOW() WHERE id = %s;",
+                            (_jsonb(new_report_json), patient_id)
+                        )
+                conn.commit()
+            except psycopg2.Error as e:
+                logger.error("Error saving turn for call session %s: %s", call_session_id, e)
+                conn.rollback()
+                raise
+
     # NOTE: create_dummy_patient_and_session is moved to backend/scripts/init_db.py
-    # and backend/scripts/setup_education_test.py for cleaner setup via scripts.
\ No newline at end of file
+    # and backend/scripts/setup_education_test.py for cleaner setup via scripts.
+
+
+@functools.lru_cache(maxsize=1)
+def get_database_manager() -> DatabaseManager:
+    """Get the process-wide DatabaseManager, so every router shares one pool"""
+    return DatabaseManager()
@@ -0,0 +1,37 @@
+# genai_pool.py
+"""
+Process-wide Gemini model registry.
+
+LLMClient is built both at startup and by each ConversationOrchestrator, and
+TKAVoiceChat builds its own model too. Every GenerativeModel carries its own
+client and transport, so models are created once per name here and shared.
+genai.configure is likewise called only when the API key changes.
+"""
+import threading
+from typing import Dict, Optional
+
+import google.generativeai as genai
+
+_MODELS: Dict[str, genai.GenerativeModel] = {}
+_configured_key: Optional[str] = None
+_lock = threading.Lock()
+
+
+def configure(api_key: str) -> None:
+    """Configures the SDK with api_key, skipping the call if it is already in use."""
+    global _configured_key
+    with _lock:
+        if api_key != _configured_key:
+            genai.configure(api_key=api_key)
+            _configured_key = api_key
+            # Models hold a client bound to the previous key
+            _MODELS.clear()
+
+
+def get_model(name: str) -> genai.GenerativeModel:
+    """Returns the shared GenerativeModel for name, creating it on first use."""
+    with _lock:
+        model = _MODELS.get(name)
+        if model is None:
+            model = _MODELS[name] = genai.GenerativeModel(name)
+        return model
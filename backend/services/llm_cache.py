@@ -0,0 +1,80 @@
+# llm_cache.py
+"""
+Exact-match cache for LLM responses.
+
+Many patient turns recur verbatim ("yes", "I'm fine", "about a 3") with the same
+history and instructions, so the full Gemini request is hashed and the response
+reused on a repeat. Keys are blake2b digests of the serialized request, so the
+cache holds 16-byte keys instead of multi-KB prompts.
+
+The NLU step gets its own cache keyed on the normalized utterance, call stage,
+call type, the question the agent last asked and the call's report data rather
+than the full request, since most of the history differs between patients while
+the extraction for "yes" to the same question at the same point of the call does
+not. The question and report data matter for context-dependent replies: a second
+"none" in MedicationReview answers allergies, not blood thinners again, and
+"just the one" means whatever the last question asked about.
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+
+class ExactLRU:
+    """Thread-safe LRU mapping request digests to response text."""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(prompt_parts: list, max_output_tokens: int) -> bytes:
+        """Digest of everything that determines the response."""
+        payload = json.dumps([prompt_parts, max_output_tokens], sort_keys=True, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: bytes, response: str) -> None:
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def build_llm_cache() -> Optional[ExactLRU]:
+    """Creates the response cache from the environment; LLM_CACHE_ENABLED=0 disables it."""
+    if os.getenv("LLM_CACHE_ENABLED", "1") == "0":
+        return None
+    return ExactLRU(maxsize=int(os.getenv("LLM_CACHE_SIZE", "2048")))
+
+
+def nlu_cache_key(user_message: str, stage: str, call_type: str,
+                  last_question: str = "", call_data: Optional[dict] = None) -> bytes:
+    """Digest of an utterance (case and whitespace folded) at a call stage, in
+    reply to last_question with the call's report data as given."""
+    normalized = " ".join(user_message.lower().split())
+    report_state = json.dumps(call_data or {}, sort_keys=True, ensure_ascii=False, default=str)
+    payload = "\x1f".join((call_type, stage, last_question, report_state, normalized))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+def build_nlu_cache() -> Optional[ExactLRU]:
+    """Creates the NLU result cache from the environment; NLU_CACHE_ENABLED=0 disables it."""
+    if os.getenv("NLU_CACHE_ENABLED", "1") == "0":
+        return None
+    return ExactLRU(maxsize=int(os.getenv("NLU_CACHE_SIZE", "1024")))
@@ -1,25 +1,23 @@
 # llm_client.py
-import google.generativeai as genai
-import os
+import logging
 
-class LLMClient:
-    def __init__(self, api_key: str):
-        print("LLM_CLIENT_INIT: Entering LLMClient constructor.") # This print should appear.
+from . import genai_pool
+from .llm_cache import build_llm_cache
+
+logger = logging.getLogger(__name__)
 
-        # --- NEW GRANULAR PRIfNTS ---
-        print("LLM_CLIENT_INIT: Calling genai.configure...")
-        genai.configure(api_key=api_key)
-        print("LLM_CLIENT_INIT: genai.configure completed.")
+class LLMClient:
+    ERROR_RESPONSE = "I apologize, but I'm having trouble connecting right now. Please try again later or contact the clinic."
 
-        print("LLM_CLIENT_INIT: Attempting to load GenerativeModel (gemini-flash)...")
-        self.model = genai.GenerativeModel('models/gemini-2.5-flash-lite')
-        print("LLM_CLIENT_INIT: GenerativeModel loaded successfully.")
-        # --- END NEW GRANULAR PRINTS ---
+    def __init__(self, api_key: str):
+        genai_pool.configure(api_key)
+        self.model = genai_pool.get_model('models/gemini-2.5-flash-lite')
+        logger.info("LLM_CLIENT_INIT: Gemini model configured and loaded.")
 
-        print("LLM_CLIENT_INIT: Gemini model configured and loaded.") # Original final print.
+        # Exact-match response cache (None when LLM_CACHE_ENABLED=0)
+        self.response_cache = build_llm_cache()
 
     def generate_response(self, prompt_parts: list, max_output_tokens: int = 250) -> str:
-        print("LLM_CLIENT: Calling Gemini Flash API.") # Add this
         """
         Calls Gemini Flash to generate a conversational response.
         
@@ -31,13 +29,10 @@ class LLMClient:
         Returns:
             The generated text response.
         """
-        generation_config = {
-            "max_output_tokens": max_output_tokens,
-            "temperature": 0.7, # Adjust for creativity (lower for more factual/direct)
-            "top_p": 0.95,
-            "top_k": 60
-        }
-        
+        cache_key, cached = self._cache_lookup(prompt_parts, max_output_tokens)
+        if cached is not None:
+            return cached
+
         try:
             # The API expects messages as a list of dictionaries with "role" and "parts"
             # We'll construct this from prompt_parts which comes from PromptGenerator
@@ -47,14 +42,43 @@ class LLMClient:
             
             response = self.model.generate_content(
                 prompt_parts, # Pass the list of messages
-                generation_config=generation_config
+                generation_config=self._generation_config(max_output_tokens)
             )
-            print("LLM_CLIENT: Received response from Gemini Flash API.") # Add this
-            
-            # Check if response exists and has text
-            if response and response.candidates:
-                return response.candidates[0].content.parts[0].text
-            return "..." # Fallback response
+            return self._response_text(response, cache_key)
         except Exception as e:
-            print(f"LLM_CLIENT: Error calling Gemini Flash: {e}") # Add this
-            return "I apologize, but I'm having trouble connecting right now. Please try again later or contact the clinic."
\ No newline at end of file
+            logger.error("LLM_CLIENT: Error calling Gemini Flash: %s", e)
+            return self.ERROR_RESPONSE
+
+    def _cache_lookup(self, prompt_parts: list, max_output_tokens: int):
+        """Returns (cache_key, cached_text); both None when caching is disabled
+        or the prompt can't be keyed, in which case the call goes out uncached."""
+        if self.response_cache is None:
+            return None, None
+        try:
+            cache_key = self.response_cache.key(prompt_parts, max_output_tokens)
+        except (TypeError, ValueError) as e:
+            logger.debug("LLM_CLIENT: Prompt not cacheable, calling uncached: %s", e)
+            return None, None
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("LLM_CLIENT: Response served from cache.")
+        return cache_key, cached
+
+    @staticmethod
+    def _generation_config(max_output_tokens: int) -> dict:
+        return {
+            "max_output_tokens": max_output_tokens,
+            "temperature": 0.7, # Adjust for creativity (lower for more factual/direct)
+            "top_p": 0.95,
+            "top_k": 60
+        }
+
+    def _response_text(self, response, cache_key) -> str:
+        # Check if response exists and has text
+        if response and response.candidates:
+            text = response.candidates[0].content.parts[0].text
+            # Only real model output is cached, never fallbacks or errors
+            if cache_key is not None:
+                self.response_cache.put(cache_key, text)
+            return text
+        return "..." # Fallback response
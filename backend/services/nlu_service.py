@@ -1,5 +1,24 @@
 from typing import Dict, Any, TypedDict
 import json
+import re
+
+# Keyword vocabularies compiled into one alternation each, so a message is
+# scanned once per vocabulary instead of once per word. Word boundaries keep
+# "no" from matching inside "noodle" or "son" inside "reason".
+_SUPPORT_RE = re.compile(r"\b(?:husband|wife|friend|family|daughter|son)\b", re.IGNORECASE)
+_PAIN_RE = re.compile(r"\b(?:10|[1-9])\b")
+_INTENT_RE = re.compile(r"\b(?:(?P<confirm>yes|right)|(?P<deny>no|wrong))\b|(?P<ask_question>\?)", re.IGNORECASE)
+# Intents in priority order when a message matches several
+_INTENT_PRIORITY = ("confirm", "deny", "ask_question")
+
+# Dialogue state transitions, built once rather than on every turn
+_TRANSITIONS = {
+    "STARTED": "ASKING_FEELINGS",
+    "ASKING_FEELINGS": "ASKING_PAIN",
+    "ASKING_PAIN": "ASKING_ACTIVITIES",
+    "ASKING_ACTIVITIES": "ASKING_SUPPORT",
+    "ASKING_SUPPORT": "COMPLETED",
+}
 
 class NLUResponse(TypedDict, total=False):
     intent: str
@@ -24,30 +43,29 @@ class NLUService:
         return self._mock_nlu_processing(request)
 
     def _mock_nlu_processing(self, request: NLURequest) -> NLUResponse:
-        user_message = request['user_message'].lower()
+        # Patterns are case-insensitive, so the message is scanned as-is without a lowered copy
+        user_message = request['user_message']
         state = request['dialogue_state']
         entities = {}
         intent = "provide_information" # Default intent
 
         # Simple rule-based entity extraction
         if state == "ASKING_PAIN":
-            for i in range(1, 11):
-                if str(i) in user_message:
-                    entities['pain_level'] = i
+            match = _PAIN_RE.search(user_message)
+            if match:
+                entities['pain_level'] = int(match.group())
         
         if state == "ASKING_SUPPORT":
-            support_words = ["husband", "wife", "friend", "family", "daughter", "son"]
-            for word in support_words:
-                if word in user_message:
-                    entities['support_person'] = word
+            match = _SUPPORT_RE.search(user_message)
+            if match:
+                entities['support_person'] = match.group().lower()
 
         # Simple intent detection
-        if "yes" in user_message or "right" in user_message:
-            intent = "confirm"
-        elif "no" in user_message or "wrong" in user_message:
-            intent = "deny"
-        elif "?" in user_message:
-            intent = "ask_question"
+        matched = {m.lastgroup for m in _INTENT_RE.finditer(user_message)}
+        for candidate in _INTENT_PRIORITY:
+            if candidate in matched:
+                intent = candidate
+                break
             
         return {
             "intent": intent,
@@ -58,14 +76,7 @@ class NLUService:
 
     def _determine_next_state(self, current_state: str, intent: str, entities: Dict[str, Any]) -> str:
         # This is the core of the state machine logic
-        transitions = {
-            "STARTED": "ASKING_FEELINGS",
-            "ASKING_FEELINGS": "ASKING_PAIN",
-            "ASKING_PAIN": "ASKING_ACTIVITIES",
-            "ASKING_ACTIVITIES": "ASKING_SUPPORT",
-            "ASKING_SUPPORT": "COMPLETED",
-        }
-        return transitions.get(current_state, current_state) # Default to staying in the same state
+        return _TRANSITIONS.get(current_state, current_state) # Default to staying in the same state
 
 _nlu_service = None
 
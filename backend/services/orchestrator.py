@@ -1,44 +1,154 @@
 # orchestrator.py
 from .llm_client import LLMClient # Assuming llm_client.py
 from .prompt_generator import PromptGenerator # Assuming prompt_generator.py
+from .llm_cache import build_nlu_cache, nlu_cache_key
 import json
 import datetime
 import os 
 import re # For basic parsing of NLU JSON output
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+# Shared decoder for NLU replies; raw_decode stops after the leading JSON value
+_JSON_DECODER = json.JSONDecoder()
+
+_PAIN_NUMBER_RE = re.compile(r'\b([0-9]|10)\b')
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+class _Keywords:
+    """A keyword vocabulary: single words matched as whole tokens, phrases by substring."""
+    __slots__ = ("words", "phrases")
+
+    def __init__(self, *keywords: str):
+        self.words = frozenset(k for k in keywords if " " not in k)
+        self.phrases = tuple(k for k in keywords if " " in k)
+
+    def found_in(self, tokens: frozenset, text: str) -> bool:
+        return not self.words.isdisjoint(tokens) or any(p in text for p in self.phrases)
+
+
+def _tokenize(text: str) -> frozenset:
+    """Words of lowercased text, with a trailing "s" also stripped ("rugs" -> "rug")."""
+    words = _WORD_RE.findall(text)
+    return frozenset(words).union(w[:-1] for w in words if w.endswith("s"))
+
+
+# _fallback_nlu keyword vocabularies. Matching whole words rather than substrings
+# keeps "reason" from reading as "son" and "know" as "no"
+_ACTIVITY_WORDS = ("standing", "walking", "sitting", "climbing", "stairs", "bending", "kneeling", "getting up", "lying down")
+_HELPER_WORDS = ("wife", "husband", "daughter", "son", "friend", "mother", "father", "sister", "brother", "family")
+_CONFIRM_YES = _Keywords("yes", "yeah", "sure", "ok", "okay", "correct", "right")
+_CONFIRM_NO = _Keywords("no", "nope", "wrong", "incorrect")
+_HAZARD_REMOVAL = _Keywords("removed", "remove", "cleared", "clear", "them", "rug", "hazard")
+_SAFETY = _Keywords("rug", "carpet", "hazard", "trip", "remove", "clean", "space", "bedroom", "recovery")
+_RECOVERY_SPACE = _Keywords("bedroom", "space", "downstairs", "bed", "room")
+_SPACE_READY = _Keywords("set up", "ready", "prepared", "yes", "have")
+_TRIP_HAZARD = _Keywords("rug", "hazard", "trip", "remove", "clean")
+_HAZARD_CLEARED = _Keywords("removed", "cleared", "clean", "yes", "done")
+_EQUIPMENT = _Keywords("toilet seat", "grabber", "tool", "reacher", "equipment", "walker", "shower chair")
+_TOILET_SEAT_HAVE = _Keywords("have", "got", "installed", "ready")
+_EQUIPMENT_HAVE = _Keywords("have", "got", "ready")
+_EQUIPMENT_NEEDED = _Keywords("no", "not", "need", "arrange", "get", "don't have")
+_GRABBER = _Keywords("grabber", "tool", "reacher")
+_CONTEXT_YES = _Keywords("yes", "have", "got")
+_EQUIPMENT_NO = _Keywords("no", "not yet", "don't have", "need to arrange")
+_MEDICATION = _Keywords("aspirin", "warfarin", "eliquis", "blood thinner", "medication", "medicine", "allergy", "allergic", "condition", "diabetes", "heart", "blood pressure")
+_BLOOD_THINNER = _Keywords("aspirin", "warfarin", "eliquis", "blood thinner")
+_ALLERGY = _Keywords("allergy", "allergic")
+_CONDITION = _Keywords("diabetes", "heart", "blood pressure", "condition")
+_NEGATIVE = _Keywords("no", "none", "nothing", "not", "don't", "don't have", "don't take")
+
+
+def _is_empty(value) -> bool:
+    """Whether a report data point is still unanswered: missing, None, "" or []."""
+    return value is None or value == '' or (isinstance(value, list) and not value)
+
+
+def _extract_json_substring(text: str) -> Optional[str]:
+    """Returns the first balanced {...} block in text, or None.
+
+    A single pass tracking brace depth and string state, so braces inside JSON
+    strings are ignored and nested objects of any depth are returned whole.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escape = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+@lru_cache(maxsize=256)
+def _surgery_date_text(surgery_date) -> str:
+    """Surgery date as spoken in prompts, formatted once per date rather than per turn"""
+    return surgery_date.strftime("%B %d, %Y") if surgery_date else "your scheduled date"
+
 
 class ConversationOrchestrator:
+    # Rule-based NLU intents trusted without an LLM call for short utterances, and
+    # the stages (before the user's message) where that intent is the expected answer
+    CONFIDENT_RULE_STAGES: Mapping[str, frozenset] = MappingProxyType({
+        "confirm_yes": frozenset({"InitialConfirmation", "SurgeryDateConfirmation", "HomeSafetyAssessment",
+                                  "MedicalEquipmentAssessment", "MedicationReview"}),
+        "confirm_no": frozenset({"InitialConfirmation", "SurgeryDateConfirmation", "MedicationReview"}),
+        "report_pain": frozenset({"PainAssessment"}),
+        "identify_helper": frozenset({"SupportSystemAssessment"}),
+    })
+    CONFIDENT_RULE_MAX_WORDS = 3
+
+    # Call stages and what's expected for completion for Call 1. Shared by every
+    # instance and read-only; in a real system, these would be loaded from a config/DB
+    CALL_1_STAGES: Mapping[str, str] = MappingProxyType({
+        "START": "Greeting",
+        "Greeting": "ConfirmSurgeryDate",
+        "ConfirmSurgeryDate": "PainAssessment",
+        "PainAssessment": "MobilityAssessment",
+        "MobilityAssessment": "SupportSystemAssessment",
+        "SupportSystemAssessment": "Closing",
+        "Closing": "COMPLETED"
+    })
+
+    # Expected data points for each assessment area (for tracking completion)
+    ASSESSMENT_AREA_DATA_POINTS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        # Initial Clinical Assessment Call (call_type="initial_assessment")
+        "PainAssessment": ("pain_level",),
+        "MobilityAssessment": ("difficult_activities_pain",),
+        "SupportSystemAssessment": ("primary_helper_identified",),
+
+        # Preparation Call (call_type="preparation") - Updated structure
+        "HomeSafetyAssessment": ("recovery_space_prepared", "trip_hazards_removed"),
+        "MedicalEquipmentAssessment": ("assistive_tools_list",),
+        "MedicationReview": ("blood_thinning_medications", "medical_conditions_list", "allergies_list")
+    })
+
     def __init__(self):
         print("ORCHESTRATOR_INIT: Initializing ConversationOrchestrator instance.")
         # Initialize LLM Client (API Key from environment)
         self.llm_client = LLMClient(os.getenv("GEMINI_API_KEY"))
         self.prompt_generator = PromptGenerator()
+        # NLU results by (utterance, stage, call type, open data points); None when NLU_CACHE_ENABLED=0
+        self.nlu_cache = build_nlu_cache()
         print("ORCHESTRATOR_INIT: ConversationOrchestrator instance fully initialized.")
-        
-        # Define call stages and what's expected for completion for Call 1
-        # In a real system, these would be loaded from a config/DB
-        self.CALL_1_STAGES = {
-            "START": "Greeting",
-            "Greeting": "ConfirmSurgeryDate",
-            "ConfirmSurgeryDate": "PainAssessment",
-            "PainAssessment": "MobilityAssessment",
-            "MobilityAssessment": "SupportSystemAssessment",
-            "SupportSystemAssessment": "Closing",
-            "Closing": "COMPLETED"
-        }
-        
-        # Define expected data points for each assessment area (for tracking completion)
-        self.ASSESSMENT_AREA_DATA_POINTS = {
-            # Initial Clinical Assessment Call (call_type="initial_assessment")
-            "PainAssessment": ["pain_level"],
-            "MobilityAssessment": ["difficult_activities_pain"],
-            "SupportSystemAssessment": ["primary_helper_identified"],
-            
-            # Preparation Call (call_type="preparation") - Updated structure
-            "HomeSafetyAssessment": ["recovery_space_prepared", "trip_hazards_removed"],
-            "MedicalEquipmentAssessment": ["assistive_tools_list"],
-            "MedicationReview": ["blood_thinning_medications", "medical_conditions_list", "allergies_list"]
-        }
-
 
     def _get_current_call_stage(self, conversation_history: list, report: dict, call_type: str) -> str:
         """Determines the current stage of the pre-operative call based on conversation and data."""
@@ -76,7 +186,7 @@ class ConversationOrchestrator:
         
     def _is_area_complete(self, report: dict, area_name: str) -> bool:
         """Checks if all required data points for an assessment area are in report."""
-        required_data_points = self.ASSESSMENT_AREA_DATA_POINTS.get(area_name, [])
+        required_data_points = self.ASSESSMENT_AREA_DATA_POINTS.get(area_name, ())
         for dp in required_data_points:
             if dp not in report or report.get(dp) is None or report.get(dp) == '':
                 return False
@@ -84,7 +194,11 @@ class ConversationOrchestrator:
     
     def _is_area_complete_by_call_type(self, report: dict, area_name: str, call_type: str) -> bool:
         """Checks if all required data points for an assessment area are complete for the specific call type."""
-        required_data_points = self.ASSESSMENT_AREA_DATA_POINTS.get(area_name, [])
+        return not self._open_data_points(report, area_name, call_type)
+
+    def _open_data_points(self, report: dict, area_name: str, call_type: str) -> tuple:
+        """Required data points of an assessment area not yet answered for the specific call type."""
+        required_data_points = self.ASSESSMENT_AREA_DATA_POINTS.get(area_name, ())
         
         if call_type == "preparation":
             call_data = report.get("preparation_call", {})
@@ -92,47 +206,22 @@ class ConversationOrchestrator:
             call_data = report.get("initial_assessment_call", {})
         
         # Special handling for MedicationReview to ensure all three areas are addressed
+        # (either with content or explicitly marked as "none")
         if area_name == "MedicationReview" and call_type == "preparation":
-            blood_thinners = call_data.get("blood_thinning_medications", [])
-            allergies = call_data.get("allergies_list", [])
-            medical_conditions = call_data.get("medical_conditions_list", [])
-            
-            # All three areas must have been addressed (either with content or explicitly marked as "none")
-            if not blood_thinners and not allergies and not medical_conditions:
-                return False
-            elif blood_thinners and not allergies and not medical_conditions:
-                return False
-            elif blood_thinners and allergies and not medical_conditions:
-                return False
-            else:
-                return True
+            return tuple(dp for dp in required_data_points if not call_data.get(dp))
         
         # Standard logic for other areas
-        for dp in required_data_points:
-            if dp not in call_data:
-                return False
-            elif call_data.get(dp) is None or call_data.get(dp) == '':
-                return False
-            elif isinstance(call_data.get(dp), list) and len(call_data.get(dp)) == 0:
-                return False
-        return True
+        return tuple(dp for dp in required_data_points if _is_empty(call_data.get(dp)))
     
     
     def _parse_llm_json_output(self, llm_response_text: str) -> dict:
         """Robustly parses JSON output from LLM, handling common LLM formatting issues."""
-        # Clean up common markdown formatting from the start and end of the string
+        # Clean up common markdown formatting from the start of the string; a
+        # closing fence or trailing text is left for raw_decode to stop at
         cleaned_text = llm_response_text.strip()
-        
-        # Remove markdown code blocks
-        if cleaned_text.startswith("```json"):
-            cleaned_text = cleaned_text[7:]
-        elif cleaned_text.startswith("```"):
-            cleaned_text = cleaned_text[3:]
-        if cleaned_text.endswith("```"):
-            cleaned_text = cleaned_text[:-3]
-        
-        # Remove any leading/trailing text that might not be JSON
-        cleaned_text = cleaned_text.strip()
+        if cleaned_text.startswith("```"):
+            cleaned_text = cleaned_text[7:] if cleaned_text.startswith("```json") else cleaned_text[3:]
+            cleaned_text = cleaned_text.strip()
         
         # Remove common prefixes/suffixes that LLMs might add
         prefixes_to_remove = ["Response:", "JSON:", "Result:", "Output:"]
@@ -141,78 +230,77 @@ class ConversationOrchestrator:
                 cleaned_text = cleaned_text[len(prefix):].strip()
 
         try:
-            # Try direct parse
-            return json.loads(cleaned_text)
+            # Try direct parse of the leading JSON value
+            result, _ = _JSON_DECODER.raw_decode(cleaned_text)
+            return result
         except json.JSONDecodeError:
             # Sometimes LLMs add text before/after JSON, or extra chars
             print(f"LLM did not output clean JSON: '{cleaned_text}'")
             
-            # Try to find JSON block using more robust regex
-            json_patterns = [
-                r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}',  # Simple nested JSON
-                r'\{.*?\}',  # Greedy match
-                r'\{[\s\S]*\}'  # Any characters including newlines
-            ]
-            
-            for pattern in json_patterns:
-                json_match = re.search(pattern, cleaned_text)
-                if json_match:
-                    try:
-                        result = json.loads(json_match.group(0))
-                        print(f"Successfully parsed JSON with pattern: {pattern}")
-                        return result
-                    except json.JSONDecodeError:
-                        continue
+            # Try the first balanced {...} block in the text
+            json_block = _extract_json_substring(cleaned_text)
+            if json_block is not None:
+                try:
+                    return _JSON_DECODER.decode(json_block)
+                except json.JSONDecodeError:
+                    pass
             
             print(f"All JSON parsing attempts failed for: '{llm_response_text}'")
             return {"intent": "unknown", "entities": {}, "parse_error": "json_decode_failed"}
     
-    def _fallback_nlu(self, user_message: str, report: dict, call_type: str = "initial_assessment") -> dict:
-        """Simple rule-based NLU fallback when LLM parsing fails."""
+    def _fallback_nlu(self, user_message: str, report: dict, call_type: str = "initial_assessment",
+                      stage: Optional[str] = None) -> dict:
+        """Simple rule-based NLU fallback when LLM parsing fails.
+
+        Equipment and medication answers are only read from a preparation call at
+        the stage (before the user's message) that asks about them.
+        """
         message_lower = user_message.lower()
+        tokens = _tokenize(message_lower)
+        initial_data = report.get("initial_assessment_call", {})
+        prep_data = report.get("preparation_call", {})
+        in_equipment_stage = call_type == "preparation" and stage == "MedicalEquipmentAssessment"
+        in_medication_stage = call_type == "preparation" and stage == "MedicationReview"
         
         # Check for confirmation words with context
-        if any(word in message_lower for word in ["yes", "yeah", "sure", "ok", "okay", "correct", "right"]):
+        if _CONFIRM_YES.found_in(tokens, message_lower):
             # If they mention removal/hazards, it's specifically about trip hazards
-            if any(word in message_lower for word in ["removed", "remove", "cleared", "clear", "them", "rug", "hazard"]):
+            if _HAZARD_REMOVAL.found_in(tokens, message_lower):
                 return {"intent": "home_safety_response", "entities": {"trip_hazards": "removed"}}
             else:
                 return {"intent": "confirm_yes", "entities": {"confirmation": "yes"}}
-        if any(word in message_lower for word in ["no", "nope", "wrong", "incorrect"]):
+        if _CONFIRM_NO.found_in(tokens, message_lower):
             return {"intent": "confirm_no", "entities": {"confirmation": "no"}}
         
         # Check for pain level (numbers)
-        pain_numbers = re.findall(r'\b([0-9]|10)\b', user_message)
-        if pain_numbers and not report.get("pain_level"):
+        pain_numbers = _PAIN_NUMBER_RE.findall(user_message)
+        if pain_numbers and not initial_data.get("pain_level"):
             return {"intent": "report_pain", "entities": {"pain_level": int(pain_numbers[0])}}
         
         # Check for activity words
-        activity_words = ["standing", "walking", "sitting", "climbing", "stairs", "bending", "kneeling", "getting up", "lying down"]
-        found_activities = [word for word in activity_words if word in message_lower]
-        if found_activities and not report.get("difficult_activities_pain"):
+        found_activities = [word for word in _ACTIVITY_WORDS if word in tokens or (" " in word and word in message_lower)]
+        if found_activities and not initial_data.get("difficult_activities_pain"):
             return {"intent": "difficult_activities", "entities": {"activities": ", ".join(found_activities)}}
         
         # Check for helper words
-        helper_words = ["wife", "husband", "daughter", "son", "friend", "mother", "father", "sister", "brother", "family"]
-        found_helpers = [word for word in helper_words if word in message_lower]
-        if found_helpers and not report.get("primary_helper_identified"):
+        found_helpers = [word for word in _HELPER_WORDS if word in tokens]
+        if found_helpers and not initial_data.get("primary_helper_identified"):
             # Join multiple helpers with "and"
             helper_text = " and ".join(found_helpers) if len(found_helpers) > 1 else found_helpers[0]
             return {"intent": "identify_helper", "entities": {"helper": helper_text}}
         
         # Check for home safety words
-        safety_words = ["rug", "carpet", "hazard", "trip", "remove", "clean", "space", "bedroom", "recovery"]
-        if any(word in message_lower for word in safety_words):
+        if _SAFETY.found_in(tokens, message_lower):
             entities = {}
             # Check for recovery space setup
-            if any(word in message_lower for word in ["bedroom", "space", "downstairs", "bed", "room"]):
-                if any(word in message_lower for word in ["set up", "ready", "prepared", "yes", "have"]):
+            if _RECOVERY_SPACE.found_in(tokens, message_lower):
+                if _SPACE_READY.found_in(tokens, message_lower):
                     entities["recovery_space"] = "prepared"
                 else:
                     entities["recovery_space"] = "discussed"
             # Check for trip hazard removal
-            if any(word in message_lower for word in ["rug", "hazard", "trip", "remove", "clean"]):
-                if any(word in message_lower for word in ["removed", "cleared", "clean", "yes", "done"]):
+            if _TRIP_HAZARD.found_in(tokens, message_lower):
+                if _HAZARD_CLEARED.found_in(tokens, message_lower):
                     entities["trip_hazards"] = "removed"
                 else:
                     entities["trip_hazards"] = "discussed"
@@ -220,35 +308,33 @@ class ConversationOrchestrator:
                 return {"intent": "home_safety_response", "entities": entities}
         
         # Check for equipment words
-        equipment_words = ["toilet seat", "grabber", "tool", "reacher", "equipment", "walker", "shower chair"]
-        if any(word in message_lower for word in equipment_words):
+        if in_equipment_stage and _EQUIPMENT.found_in(tokens, message_lower):
             entities = {}
             if "toilet seat" in message_lower:
-                if any(word in message_lower for word in ["have", "got", "installed", "ready"]):
+                if _TOILET_SEAT_HAVE.found_in(tokens, message_lower):
                     entities["toilet_seat"] = "obtained"
-                elif any(word in message_lower for word in ["no", "not", "need", "arrange", "get", "don't have"]):
+                elif _EQUIPMENT_NEEDED.found_in(tokens, message_lower):
                     entities["toilet_seat"] = "needed"
-            if any(word in message_lower for word in ["grabber", "tool", "reacher"]):
-                if any(word in message_lower for word in ["have", "got", "ready"]):
+            if _GRABBER.found_in(tokens, message_lower):
+                if _EQUIPMENT_HAVE.found_in(tokens, message_lower):
                     entities["grabber_tool"] = "obtained"
-                elif any(word in message_lower for word in ["no", "not", "need", "arrange", "get", "don't have"]):
+                elif _EQUIPMENT_NEEDED.found_in(tokens, message_lower):
                     entities["grabber_tool"] = "needed"
-            if "walker" in message_lower:
-                if any(word in message_lower for word in ["have", "got", "ready"]):
+            if "walker" in tokens:
+                if _EQUIPMENT_HAVE.found_in(tokens, message_lower):
                     entities["walker"] = "obtained"
-                elif any(word in message_lower for word in ["no", "not", "need", "arrange", "get", "don't have"]):
+                elif _EQUIPMENT_NEEDED.found_in(tokens, message_lower):
                     entities["walker"] = "needed"
-            if "shower chair" in message_lower or "shower chair" in message_lower:
-                if any(word in message_lower for word in ["have", "got", "ready"]):
+            if "shower chair" in message_lower:
+                if _EQUIPMENT_HAVE.found_in(tokens, message_lower):
                     entities["shower_chair"] = "obtained"
-                elif any(word in message_lower for word in ["no", "not", "need", "arrange", "get", "don't have"]):
+                elif _EQUIPMENT_NEEDED.found_in(tokens, message_lower):
                     entities["shower_chair"] = "needed"
             if entities:
                 return {"intent": "equipment_response", "entities": entities}
         
         # Check for contextual "yes" responses in equipment stage
-        prep_data = report.get("preparation_call", {})
-        if any(word in message_lower for word in ["yes", "have", "got"]) and call_type == "preparation":
+        if in_equipment_stage and _CONTEXT_YES.found_in(tokens, message_lower):
             # If we're in equipment stage and they say "yes", try to determine what they're confirming
             if not prep_data.get("raised_toilet_seat_obtained"):
                 # Asking about toilet seat, they said yes
@@ -258,36 +344,35 @@ class ConversationOrchestrator:
                 return {"intent": "equipment_response", "entities": {"grabber_tool": "obtained"}}
         
         # Check for explicit "no" responses about equipment when in equipment stage
-        if any(word in message_lower for word in ["no", "not yet", "don't have", "need to arrange"]):
-            if not report.get("preparation_call", {}).get("raised_toilet_seat_obtained"):
+        if in_equipment_stage and _EQUIPMENT_NO.found_in(tokens, message_lower):
+            if not prep_data.get("raised_toilet_seat_obtained"):
                 return {"intent": "equipment_response", "entities": {"toilet_seat": "needed"}}
         
         # Check for medication words
-        medication_words = ["aspirin", "warfarin", "eliquis", "blood thinner", "medication", "medicine", "allergy", "allergic", "condition", "diabetes", "heart", "blood pressure"]
-        if any(word in message_lower for word in medication_words):
+        if in_medication_stage and _MEDICATION.found_in(tokens, message_lower):
             entities = {}
-            if any(word in message_lower for word in ["aspirin", "warfarin", "eliquis", "blood thinner"]):
-                if "aspirin" in message_lower:
+            if _BLOOD_THINNER.found_in(tokens, message_lower):
+                if "aspirin" in tokens:
                     entities["blood_thinners"] = "aspirin"
-                elif "warfarin" in message_lower:
+                elif "warfarin" in tokens:
                     entities["blood_thinners"] = "warfarin"
-                elif "eliquis" in message_lower:
+                elif "eliquis" in tokens:
                     entities["blood_thinners"] = "eliquis"
                 else:
                     entities["blood_thinners"] = "none"
-            elif any(word in message_lower for word in ["allergy", "allergic"]):
+            elif _ALLERGY.found_in(tokens, message_lower):
                 # Extract allergy information
-                if "penicillin" in message_lower:
+                if "penicillin" in tokens:
                     entities["allergies"] = "penicillin"
-                elif "latex" in message_lower:
+                elif "latex" in tokens:
                     entities["allergies"] = "latex"
                 else:
                     entities["allergies"] = "none"
-            elif any(word in message_lower for word in ["diabetes", "heart", "blood pressure", "condition"]):
+            elif _CONDITION.found_in(tokens, message_lower):
                 # Extract medical conditions
-                if "diabetes" in message_lower:
+                if "diabetes" in tokens:
                     entities["medical_conditions"] = "diabetes"
-                elif "heart" in message_lower:
+                elif "heart" in tokens:
                     entities["medical_conditions"] = "heart condition"
                 elif "blood pressure" in message_lower:
                     entities["medical_conditions"] = "high blood pressure"
@@ -297,9 +382,8 @@ class ConversationOrchestrator:
                 return {"intent": "medication_response", "entities": entities}
         
         # Check for negative responses about medications/allergies/conditions
-        if any(word in message_lower for word in ["no", "none", "nothing", "not", "don't", "don't have", "don't take"]):
+        if in_medication_stage and _NEGATIVE.found_in(tokens, message_lower):
             # Check if we're in medication review stage by looking at current data
-            prep_data = report.get("preparation_call", {})
             blood_thinners = prep_data.get("blood_thinning_medications", [])
             allergies = prep_data.get("allergies_list", [])
             medical_conditions = prep_data.get("medical_conditions_list", [])
@@ -316,10 +400,178 @@ class ConversationOrchestrator:
         
         return {"intent": "unknown", "entities": {}}
 
+    def _is_confident_rule_nlu(self, rule_nlu: dict, user_message: str, stage: str) -> bool:
+        """Whether a rule-based NLU result can stand in for the LLM call.
+
+        Only short utterances with one of the simple intents, at a stage that asks
+        for it, and an extracted entity qualify. A yes/no answer must be nothing but
+        yes words or nothing but no words: anything else ("yes, aspirin", "yes that's
+        wrong", "yeah, no") carries a second answer the rules would drop.
+        """
+        intent = rule_nlu["intent"]
+        if stage not in self.CONFIDENT_RULE_STAGES.get(intent, ()) or not rule_nlu["entities"]:
+            return False
+        words = _WORD_RE.findall(user_message.lower())
+        if len(words) > self.CONFIDENT_RULE_MAX_WORDS:
+            return False
+        if intent in ("confirm_yes", "confirm_no"):
+            answer_words = _CONFIRM_YES.words if intent == "confirm_yes" else _CONFIRM_NO.words
+            return answer_words.issuperset(words)
+        return True
+
+    def _llm_nlu(self, user_message: str, conversation_history: list, report: dict,
+                 stage: str, call_type: str, rule_nlu: dict) -> dict:
+        """NLU via the LLM, reusing the result for an utterance already seen in reply
+        to the same question with the same call data. rule_nlu is returned if the
+        reply can't be parsed."""
+        nlu_key = None
+        if self.nlu_cache is not None:
+            # The last question and the call's data tell apart replies that only
+            # make sense in context, e.g. "none" to blood thinners vs. to allergies
+            last_question = next(
+                (turn["content"] for turn in reversed(conversation_history) if turn["role"] == "assistant"), ""
+            )
+            call_data = report.get("preparation_call" if call_type == "preparation" else "initial_assessment_call")
+            nlu_key = nlu_cache_key(user_message, stage, call_type, last_question, call_data)
+            cached_nlu = self.nlu_cache.get(nlu_key)
+            if cached_nlu is not None:
+                # Stored as JSON so each turn gets its own copy of the entities
+                return _JSON_DECODER.decode(cached_nlu)
+
+        nlu_prompt_messages = self.prompt_generator.generate_nlu_prompt(
+            conversation_history=conversation_history,
+            user_message=user_message,
+            report=report
+        )
+        nlu_raw_response = self.llm_client.generate_response(nlu_prompt_messages, max_output_tokens=200) # NLU response should be short JSON
+        
+        # Parse NLU result
+        try:
+            nlu_result = self._parse_llm_json_output(nlu_raw_response)
+        except Exception as e:
+            # If parsing fails, use fallback NLU
+            return rule_nlu
+        
+        # Ensure nlu_result is a dictionary
+        if not isinstance(nlu_result, dict):
+            return rule_nlu
+        if nlu_key is not None and "parse_error" not in nlu_result:
+            # Only clean LLM extractions are cached, never fallbacks or parse failures
+            self.nlu_cache.put(nlu_key, json.dumps(nlu_result))
+        return nlu_result
+
     # ... (rest of class) ...
 
 
 
+    # --- Report updates, one handler per NLU intent ---
+
+    def _handle_pain(self, report: dict, entities: dict) -> None:
+        if "pain_level" not in entities:
+            return
+        try:
+            pain_level = int(entities["pain_level"])
+            initial_data = report.setdefault("initial_assessment_call", {})
+            initial_data["pain_level"] = pain_level
+            if pain_level >= 7: # Example: high pain is a critical alert
+                initial_data["high_pain_alert"] = True
+        except ValueError:
+            pass # Handle non-numeric pain
+
+    def _handle_activities(self, report: dict, entities: dict) -> None:
+        initial_data = report.setdefault("initial_assessment_call", {})
+        if "activity" in entities:
+            initial_data["difficult_activities_pain"] = entities["activity"]
+        elif "activities" in entities:
+            # Handle multiple activities (can be string or list)
+            activities = entities["activities"]
+            if isinstance(activities, list):
+                initial_data["difficult_activities_pain"] = ", ".join(activities)
+            else:
+                initial_data["difficult_activities_pain"] = str(activities)
+
+    def _handle_helper(self, report: dict, entities: dict) -> None:
+        initial_data = report.setdefault("initial_assessment_call", {})
+        if "helper_relationship" in entities:
+            initial_data["primary_helper_identified"] = entities["helper_relationship"]
+        elif "helper" in entities:
+            initial_data["primary_helper_identified"] = entities["helper"]
+
+    def _handle_safety(self, report: dict, entities: dict) -> None:
+        prep_data = report.setdefault("preparation_call", {})
+        if "recovery_space" in entities:
+            prep_data["recovery_space_prepared"] = entities["recovery_space"] == "prepared"
+        if "trip_hazards" in entities:
+            prep_data["trip_hazards_removed"] = entities["trip_hazards"] == "removed"
+
+    def _handle_equipment(self, report: dict, entities: dict) -> None:
+        tools_list = report.setdefault("preparation_call", {}).setdefault("assistive_tools_list", [])
+        # Add obtained tools to the list
+        for entity, tool in (("toilet_seat", "raised toilet seat"), ("grabber_tool", "grabber tool"),
+                             ("walker", "walker"), ("shower_chair", "shower chair")):
+            if entities.get(entity) == "obtained" and tool not in tools_list:
+                tools_list.append(tool)
+
+    def _handle_meds(self, report: dict, entities: dict) -> None:
+        prep_data = report.setdefault("preparation_call", {})
+        prep_data.setdefault("blood_thinning_medications", [])
+        prep_data.setdefault("medical_conditions_list", [])
+        prep_data.setdefault("allergies_list", [])
+
+        for entity, data_point in (("blood_thinners", "blood_thinning_medications"),
+                                   ("medical_conditions", "medical_conditions_list"),
+                                   ("allergies", "allergies_list")):
+            if entity in entities:
+                value = entities[entity]
+                prep_data[data_point] = value if isinstance(value, list) else [value]
+                break
+        else:
+            # If no specific medications mentioned, mark as empty list
+            prep_data["blood_thinning_medications"] = []
+
+    def _confirm_home_safety(self, report: dict, entities: dict) -> None:
+        prep_data = report.setdefault("preparation_call", {})
+        # Check what's missing and fill in the next item
+        if "recovery_space_prepared" not in prep_data:
+            prep_data["recovery_space_prepared"] = True
+        elif "trip_hazards_removed" not in prep_data:
+            prep_data["trip_hazards_removed"] = True
+
+    def _confirm_equipment(self, report: dict, entities: dict) -> None:
+        tools_list = report.setdefault("preparation_call", {}).setdefault("assistive_tools_list", [])
+        # Add both essential tools when user confirms
+        for tool in ("raised toilet seat", "grabber tool"):
+            if tool not in tools_list:
+                tools_list.append(tool)
+
+    def _answer_medication_question(self, report: dict, entities: dict) -> None:
+        prep_data = report.setdefault("preparation_call", {})
+        prep_data.setdefault("blood_thinning_medications", [])
+        prep_data.setdefault("medical_conditions_list", [])
+        prep_data.setdefault("allergies_list", [])
+        # A yes or no closes the next unanswered question, asked in this order
+        for data_point in ("blood_thinning_medications", "allergies_list", "medical_conditions_list"):
+            if not prep_data.get(data_point):
+                prep_data[data_point] = ["none"]
+                break
+
+    _INTENT_HANDLERS = MappingProxyType({
+        "report_pain": _handle_pain,
+        "difficult_activities": _handle_activities,
+        "identify_helper": _handle_helper,
+        "home_safety_response": _handle_safety,
+        "equipment_response": _handle_equipment,
+        "medication_response": _handle_meds,
+    })
+
+    # (intent, stage before the user's message) -> handler for stage-specific yes/no answers
+    _CONFIRMATION_HANDLERS = MappingProxyType({
+        ("confirm_yes", "HomeSafetyAssessment"): _confirm_home_safety,
+        ("confirm_yes", "MedicalEquipmentAssessment"): _confirm_equipment,
+        ("confirm_yes", "MedicationReview"): _answer_medication_question,
+        ("confirm_no", "MedicationReview"): _answer_medication_question,
+    })
+
     def get_next_agent_response(self, patient_data: dict, call_session_data: dict, user_message: str = None) -> dict:
         """
         Determines the agent's next response based on conversation state.
@@ -352,32 +604,24 @@ class ConversationOrchestrator:
             # 1. Append user message to history (for NLU context)
             conversation_history.append({"role": "user", "content": user_message})
 
-            # 2. Perform NLU (Intent & Entity Extraction) using LLM
-            nlu_prompt_messages = self.prompt_generator.generate_nlu_prompt(
-                conversation_history=conversation_history,
-                user_message=user_message,
-                report=extracted_report
-            )
-            nlu_raw_response = self.llm_client.generate_response(nlu_prompt_messages, max_output_tokens=200) # NLU response should be short JSON
-            
-            # Parse NLU result
-            try:
-                nlu_result = self._parse_llm_json_output(nlu_raw_response)
-            except Exception as e:
-                # If parsing fails, use fallback NLU
-                nlu_result = self._fallback_nlu(user_message, extracted_report, call_type)
-            
-            # Ensure nlu_result is a dictionary
-            if not isinstance(nlu_result, dict):
-                nlu_result = self._fallback_nlu(user_message, extracted_report, call_type)
+            # Determine stage before this turn to provide context for NLU interpretation
+            stage_before_user_message = self._get_current_call_stage(conversation_history[:-1], extracted_report, call_type)
+
+            # 2. Perform NLU (Intent & Entity Extraction). Short answers the rules
+            # classify unambiguously skip the LLM call
+            rule_nlu = self._fallback_nlu(user_message, extracted_report, call_type, stage_before_user_message)
+            if self._is_confident_rule_nlu(rule_nlu, user_message, stage_before_user_message):
+                nlu_result = rule_nlu
+            else:
+                nlu_result = self._llm_nlu(
+                    user_message, conversation_history, extracted_report,
+                    stage_before_user_message, call_type, rule_nlu
+                )
 
             # 3. Update report based on NLU result
             intent = nlu_result.get("intent", "unknown")
             entities = nlu_result.get("entities", {})
 
-            # Determine stage before this turn to provide context for NLU interpretation
-            stage_before_user_message = self._get_current_call_stage(conversation_history[:-1], extracted_report, call_type)
-
             # Interpret confirmation based on the stage (handles both intent and entity)
             is_confirmed = None
             if "confirmation" in entities:
@@ -393,178 +637,22 @@ class ConversationOrchestrator:
                 if stage_before_user_message == "InitialConfirmation":
                     if call_type == "preparation":
                         # Store preparation call data separately
-                        if "preparation_call" not in extracted_report:
-                            extracted_report["preparation_call"] = {}
-                        extracted_report["preparation_call"]["ready_confirmed"] = is_confirmed
+                        prep_data = extracted_report.setdefault("preparation_call", {})
+                        prep_data["ready_confirmed"] = is_confirmed
                     else:
                         # Store initial assessment call data separately
-                        if "initial_assessment_call" not in extracted_report:
-                            extracted_report["initial_assessment_call"] = {}
-                        extracted_report["initial_assessment_call"]["ready_confirmed"] = is_confirmed
+                        initial_data = extracted_report.setdefault("initial_assessment_call", {})
+                        initial_data["ready_confirmed"] = is_confirmed
                 elif stage_before_user_message == "SurgeryDateConfirmation":
-                    if "initial_assessment_call" not in extracted_report:
-                        extracted_report["initial_assessment_call"] = {}
-                    extracted_report["initial_assessment_call"]["surgery_date_confirmed"] = is_confirmed
+                    initial_data = extracted_report.setdefault("initial_assessment_call", {})
+                    initial_data["surgery_date_confirmed"] = is_confirmed
 
-            # Handle other intents
-            if intent == "report_pain" and "pain_level" in entities:
-                try:
-                    pain_level = int(entities["pain_level"])
-                    if "initial_assessment_call" not in extracted_report:
-                        extracted_report["initial_assessment_call"] = {}
-                    extracted_report["initial_assessment_call"]["pain_level"] = pain_level
-                    if pain_level >= 7: # Example: high pain is a critical alert
-                        extracted_report["initial_assessment_call"]["high_pain_alert"] = True
-                except ValueError:
-                    pass # Handle non-numeric pain
-            elif intent == "difficult_activities":
-                if "initial_assessment_call" not in extracted_report:
-                    extracted_report["initial_assessment_call"] = {}
-                if "activity" in entities:
-                    extracted_report["initial_assessment_call"]["difficult_activities_pain"] = entities["activity"]
-                elif "activities" in entities:
-                    # Handle multiple activities (can be string or list)
-                    activities = entities["activities"]
-                    if isinstance(activities, list):
-                        extracted_report["initial_assessment_call"]["difficult_activities_pain"] = ", ".join(activities)
-                    else:
-                        extracted_report["initial_assessment_call"]["difficult_activities_pain"] = str(activities)
-            elif intent == "identify_helper":
-                if "initial_assessment_call" not in extracted_report:
-                    extracted_report["initial_assessment_call"] = {}
-                if "helper_relationship" in entities:
-                    extracted_report["initial_assessment_call"]["primary_helper_identified"] = entities["helper_relationship"]
-                elif "helper" in entities:
-                    extracted_report["initial_assessment_call"]["primary_helper_identified"] = entities["helper"]
-            
-            # Handle preparation call specific intents
-            elif intent == "home_safety_response":
-                if "preparation_call" not in extracted_report:
-                    extracted_report["preparation_call"] = {}
-                if "recovery_space" in entities:
-                    extracted_report["preparation_call"]["recovery_space_prepared"] = True if entities["recovery_space"] == "prepared" else False
-                if "trip_hazards" in entities:
-                    extracted_report["preparation_call"]["trip_hazards_removed"] = True if entities["trip_hazards"] == "removed" else False
-            elif intent == "equipment_response":
-                if "preparation_call" not in extracted_report:
-                    extracted_report["preparation_call"] = {}
-                if "assistive_tools_list" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["assistive_tools_list"] = []
-                
-                # Add tools to the list
-                if "toilet_seat" in entities and entities["toilet_seat"] == "obtained":
-                    if "raised toilet seat" not in extracted_report["preparation_call"]["assistive_tools_list"]:
-                        extracted_report["preparation_call"]["assistive_tools_list"].append("raised toilet seat")
-                if "grabber_tool" in entities and entities["grabber_tool"] == "obtained":
-                    if "grabber tool" not in extracted_report["preparation_call"]["assistive_tools_list"]:
-                        extracted_report["preparation_call"]["assistive_tools_list"].append("grabber tool")
-                if "walker" in entities and entities.get("walker") == "obtained":
-                    if "walker" not in extracted_report["preparation_call"]["assistive_tools_list"]:
-                        extracted_report["preparation_call"]["assistive_tools_list"].append("walker")
-                if "shower_chair" in entities and entities.get("shower_chair") == "obtained":
-                    if "shower chair" not in extracted_report["preparation_call"]["assistive_tools_list"]:
-                        extracted_report["preparation_call"]["assistive_tools_list"].append("shower chair")
-                
-                # If both essential tools are mentioned, mark as complete
-                tools_list = extracted_report["preparation_call"]["assistive_tools_list"]
-                if ("raised toilet seat" in tools_list or "toilet seat" in tools_list) and ("grabber tool" in tools_list or "grabber" in tools_list):
-                    pass # No print here, as per instructions
-            
-            elif intent == "medication_response":
-                if "preparation_call" not in extracted_report:
-                    extracted_report["preparation_call"] = {}
-                if "blood_thinning_medications" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["blood_thinning_medications"] = []
-                if "medical_conditions_list" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["medical_conditions_list"] = []
-                if "allergies_list" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["allergies_list"] = []
-                
-                if "blood_thinners" in entities:
-                    if isinstance(entities["blood_thinners"], list):
-                        extracted_report["preparation_call"]["blood_thinning_medications"] = entities["blood_thinners"]
-                    else:
-                        extracted_report["preparation_call"]["blood_thinning_medications"] = [entities["blood_thinners"]]
-                elif "medical_conditions" in entities:
-                    if isinstance(entities["medical_conditions"], list):
-                        extracted_report["preparation_call"]["medical_conditions_list"] = entities["medical_conditions"]
-                    else:
-                        extracted_report["preparation_call"]["medical_conditions_list"] = [entities["medical_conditions"]]
-                elif "allergies" in entities:
-                    if isinstance(entities["allergies"], list):
-                        extracted_report["preparation_call"]["allergies_list"] = entities["allergies"]
-                    else:
-                        extracted_report["preparation_call"]["allergies_list"] = [entities["allergies"]]
-                else:
-                    # If no specific medications mentioned, mark as empty list
-                    extracted_report["preparation_call"]["blood_thinning_medications"] = []
-            
-            # Handle confirmations in home safety stage
-            elif intent == "confirm_yes" and stage_before_user_message == "HomeSafetyAssessment":
-                if "preparation_call" not in extracted_report:
-                    extracted_report["preparation_call"] = {}
-                
-                # Check what's missing and fill in the next item
-                prep_data = extracted_report["preparation_call"]
-                if "recovery_space_prepared" not in prep_data:
-                    extracted_report["preparation_call"]["recovery_space_prepared"] = True
-                elif "trip_hazards_removed" not in prep_data:
-                    extracted_report["preparation_call"]["trip_hazards_removed"] = True
-            
-            # Handle equipment confirmations when user says "yes" to equipment questions
-            elif intent == "confirm_yes" and stage_before_user_message == "MedicalEquipmentAssessment":
-                if "preparation_call" not in extracted_report:
-                    extracted_report["preparation_call"] = {}
-                if "assistive_tools_list" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["assistive_tools_list"] = []
-                
-                # Add both essential tools when user confirms
-                if "raised toilet seat" not in extracted_report["preparation_call"]["assistive_tools_list"]:
-                    extracted_report["preparation_call"]["assistive_tools_list"].append("raised toilet seat")
-                if "grabber tool" not in extracted_report["preparation_call"]["assistive_tools_list"]:
-                    extracted_report["preparation_call"]["assistive_tools_list"].append("grabber tool")
-            
-            # Handle medication confirmations when user says "yes" to medication questions
-            elif intent == "confirm_yes" and stage_before_user_message == "MedicationReview":
-                if "preparation_call" not in extracted_report:
-                    extracted_report["preparation_call"] = {}
-                if "blood_thinning_medications" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["blood_thinning_medications"] = []
-                if "medical_conditions_list" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["medical_conditions_list"] = []
-                if "allergies_list" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["allergies_list"] = []
-                
-                # Check what's missing and fill in the next item
-                prep_data = extracted_report["preparation_call"]
-                
-                if not prep_data.get("blood_thinning_medications"):
-                    extracted_report["preparation_call"]["blood_thinning_medications"] = ["none"]
-                elif not prep_data.get("allergies_list"):
-                    extracted_report["preparation_call"]["allergies_list"] = ["none"]
-                elif not prep_data.get("medical_conditions_list"):
-                    extracted_report["preparation_call"]["medical_conditions_list"] = ["none"]
-            
-            # Handle medication confirmations when user says "no" to medication questions
-            elif intent == "confirm_no" and stage_before_user_message == "MedicationReview":
-                if "preparation_call" not in extracted_report:
-                    extracted_report["preparation_call"] = {}
-                if "blood_thinning_medications" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["blood_thinning_medications"] = []
-                if "medical_conditions_list" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["medical_conditions_list"] = []
-                if "allergies_list" not in extracted_report["preparation_call"]:
-                    extracted_report["preparation_call"]["allergies_list"] = []
-                
-                # Check what's missing and fill in the next item
-                prep_data = extracted_report["preparation_call"]
-                
-                if not prep_data.get("blood_thinning_medications"):
-                    extracted_report["preparation_call"]["blood_thinning_medications"] = ["none"]
-                elif not prep_data.get("allergies_list"):
-                    extracted_report["preparation_call"]["allergies_list"] = ["none"]
-                elif not prep_data.get("medical_conditions_list"):
-                    extracted_report["preparation_call"]["medical_conditions_list"] = ["none"]
+            # Handle other intents, then yes/no answers whose meaning depends on the stage
+            handler = self._INTENT_HANDLERS.get(intent)
+            if handler is None:
+                handler = self._CONFIRMATION_HANDLERS.get((intent, stage_before_user_message))
+            if handler is not None:
+                handler(self, extracted_report, entities)
 
         # --- Determine Current Call Stage & Generate Agent Response ---
         current_stage = self._get_current_call_stage(conversation_history, extracted_report, call_type)
@@ -583,13 +671,14 @@ class ConversationOrchestrator:
     def _handle_initial_assessment_call_logic(self, current_stage, conversation_history, extracted_report, 
                                            patient_data, actual_call_start, new_call_status, call_duration_seconds, nlu_result):
         """Handle all logic specific to initial clinical assessment calls"""
+        surgery_date = _surgery_date_text(patient_data.get("surgery_date"))
         
         if current_stage == "Greeting":
             agent_response_prompt_messages = self.prompt_generator.generate_agent_response_prompt(
                 conversation_history=conversation_history,
                 current_stage="Greeting",
                 patient_name=patient_data["first_name"], # Assuming 'name' field in patient_data
-                surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                surgery_date=surgery_date,
                 report=extracted_report
             )
             agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120) # Allow for empathetic greeting
@@ -600,18 +689,19 @@ class ConversationOrchestrator:
         
         elif current_stage == "InitialConfirmation":
             # Logic handled by NLU result and _get_current_call_stage
-            if extracted_report.get("initial_assessment_call", {}).get("ready_confirmed") is True:
+            ready_confirmed = extracted_report.get("initial_assessment_call", {}).get("ready_confirmed")
+            if ready_confirmed is True:
                 # Transition to ConfirmSurgeryDate
                 agent_response_prompt_messages = self.prompt_generator.generate_agent_response_prompt(
                     conversation_history=conversation_history,
                     current_stage="SurgeryDateConfirmation",
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
                 current_stage = "SurgeryDateConfirmation" # Update stage immediately for the next loop/logic if this were a single pass
-            elif extracted_report.get("initial_assessment_call", {}).get("ready_confirmed") is False:
+            elif ready_confirmed is False:
                 agent_response_text = "I understand. Please contact the clinic to update this call timing."
                 new_call_status = "reschedule_required"
             else: # If NLU couldn't confirm, or first pass
@@ -619,7 +709,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="Greeting", # Stay in greeting context if not understood
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                  agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -631,7 +721,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="PainAssessment", # Transition to first assessment area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -644,7 +734,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="SurgeryDateConfirmation", # Stay in confirmation context if not understood
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -656,7 +746,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="MobilityAssessment", # Transition to next area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -667,7 +757,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="PainAssessment", # Stay in current area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -678,7 +768,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="SupportSystemAssessment", # Transition to next area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -689,7 +779,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="MobilityAssessment", # Stay in current area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -700,7 +790,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="Closing", # Transition to closing
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -713,7 +803,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="SupportSystemAssessment", # Stay in current area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -725,7 +815,7 @@ class ConversationOrchestrator:
                 conversation_history=conversation_history,
                 current_stage="Closing",
                 patient_name=patient_data["first_name"],
-                surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                surgery_date=surgery_date,
                 report=extracted_report
             )
             agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -750,13 +840,14 @@ class ConversationOrchestrator:
     def _handle_preparation_call_logic(self, current_stage, conversation_history, extracted_report, 
                                      patient_data, actual_call_start, new_call_status, call_duration_seconds, nlu_result):
         """Handle all logic specific to preparation calls"""
+        surgery_date = _surgery_date_text(patient_data.get("surgery_date"))
         
         if current_stage == "Greeting":
             agent_response_prompt_messages = self.prompt_generator.generate_agent_response_prompt(
                 conversation_history=conversation_history,
                 current_stage="Greeting",
                 patient_name=patient_data["first_name"],
-                surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                surgery_date=surgery_date,
                 report=extracted_report
             )
             agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -769,7 +860,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="HomeSafetyAssessment",
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -779,7 +870,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="InitialConfirmation",
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -790,7 +881,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="MedicalEquipmentAssessment", # Transition to next area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -801,7 +892,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="HomeSafetyAssessment", # Stay in current area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -812,7 +903,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="MedicationReview", # Transition to next area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -823,7 +914,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="MedicalEquipmentAssessment", # Stay in current area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -834,7 +925,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="Closing", # Transition to closing
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -847,7 +938,7 @@ class ConversationOrchestrator:
                     conversation_history=conversation_history,
                     current_stage="MedicationReview", # Stay in current area
                     patient_name=patient_data["first_name"],
-                    surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                    surgery_date=surgery_date,
                     report=extracted_report
                 )
                 agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -858,7 +949,7 @@ class ConversationOrchestrator:
                 conversation_history=conversation_history,
                 current_stage="Closing",
                 patient_name=patient_data["first_name"],
-                surgery_date=patient_data.get("surgery_date").strftime("%B %d, %Y") if patient_data.get("surgery_date") else "your scheduled date",
+                surgery_date=surgery_date,
                 report=extracted_report
             )
             agent_response_text = self.llm_client.generate_response(agent_response_prompt_messages, max_output_tokens=120)
@@ -18,6 +18,26 @@ class PromptGenerator:
     - Keep responses focused but not rushed (2-4 sentences max)
     """
 
+    # --- Static NLU instructions (only the current report is appended per call) ---
+    NLU_INSTRUCTIONS = (
+        "You are an NLU (Natural Language Understanding) system. Your ONLY job is to extract intent and entities from user messages.\n"
+        "IMPORTANT: Return ONLY valid JSON. No other text, no explanations, no conversational responses.\n"
+        "Extract intent and entities from user message.\n"
+        "Valid intents: ready_to_begin, confirm_yes, confirm_no, report_pain, difficult_activities, identify_helper, home_safety_response, equipment_response, medication_response, unknown\n"
+        "Examples:\n"
+        "User: 'Yes' → {\"intent\": \"confirm_yes\", \"entities\": {}}\n"
+        "User: 'My pain is 9' → {\"intent\": \"report_pain\", \"entities\": {\"pain_level\": 9}}\n"
+        "User: 'standing and walking are hard' → {\"intent\": \"difficult_activities\", \"entities\": {\"activities\": \"standing, walking\"}}\n"
+        "User: 'my wife helps me' → {\"intent\": \"identify_helper\", \"entities\": {\"helper\": \"wife\"}}\n"
+        "User: 'I removed the rugs and set up my bedroom' → {\"intent\": \"home_safety_response\", \"entities\": {\"trip_hazards\": \"removed\", \"recovery_space\": \"prepared\"}}\n"
+        "User: 'I have the toilet seat but need to get the grabber' → {\"intent\": \"equipment_response\", \"entities\": {\"toilet_seat\": \"obtained\", \"grabber_tool\": \"needed\"}}\n"
+        "User: 'I take aspirin daily' → {\"intent\": \"medication_response\", \"entities\": {\"blood_thinners\": \"aspirin\"}}\n"
+        "User: 'No, I don't take any blood thinners' → {\"intent\": \"medication_response\", \"entities\": {\"blood_thinners\": \"none\"}}\n"
+        "User: 'I'm allergic to penicillin' → {\"intent\": \"medication_response\", \"entities\": {\"allergies\": \"penicillin\"}}\n"
+        "User: 'I have diabetes' → {\"intent\": \"medication_response\", \"entities\": {\"medical_conditions\": \"diabetes\"}}\n"
+        "User: 'yes taking aspirin' → {\"intent\": \"medication_response\", \"entities\": {\"blood_thinners\": \"aspirin\"}}\n"
+    )
+
     # --- LLM for NLU Extraction Prompt ---
     def generate_nlu_prompt(self, conversation_history: list, user_message: str, report: dict) -> list:
         """
@@ -36,26 +56,9 @@ class PromptGenerator:
             formatted_conv_history_for_llm.append({"role": role, "parts": [{"text": turn["content"]}]})
 
 
-        nlu_instruction_text = (
-            "You are an NLU (Natural Language Understanding) system. Your ONLY job is to extract intent and entities from user messages.\n"
-            "IMPORTANT: Return ONLY valid JSON. No other text, no explanations, no conversational responses.\n"
-            "Extract intent and entities from user message.\n"
-            "Valid intents: ready_to_begin, confirm_yes, confirm_no, report_pain, difficult_activities, identify_helper, home_safety_response, equipment_response, medication_response, unknown\n"
-            "Examples:\n"
-            "User: 'Yes' → {\"intent\": \"confirm_yes\", \"entities\": {}}\n"
-            "User: 'My pain is 9' → {\"intent\": \"report_pain\", \"entities\": {\"pain_level\": 9}}\n"
-            "User: 'standing and walking are hard' → {\"intent\": \"difficult_activities\", \"entities\": {\"activities\": \"standing, walking\"}}\n"
-            "User: 'my wife helps me' → {\"intent\": \"identify_helper\", \"entities\": {\"helper\": \"wife\"}}\n"
-            "User: 'I removed the rugs and set up my bedroom' → {\"intent\": \"home_safety_response\", \"entities\": {\"trip_hazards\": \"removed\", \"recovery_space\": \"prepared\"}}\n"
-            "User: 'I have the toilet seat but need to get the grabber' → {\"intent\": \"equipment_response\", \"entities\": {\"toilet_seat\": \"obtained\", \"grabber_tool\": \"needed\"}}\n"
-            "User: 'I take aspirin daily' → {\"intent\": \"medication_response\", \"entities\": {\"blood_thinners\": \"aspirin\"}}\n"
-            "User: 'No, I don't take any blood thinners' → {\"intent\": \"medication_response\", \"entities\": {\"blood_thinners\": \"none\"}}\n"
-            "User: 'I'm allergic to penicillin' → {\"intent\": \"medication_response\", \"entities\": {\"allergies\": \"penicillin\"}}\n"
-            "User: 'I have diabetes' → {\"intent\": \"medication_response\", \"entities\": {\"medical_conditions\": \"diabetes\"}}\n"
-            "User: 'yes taking aspirin' → {\"intent\": \"medication_response\", \"entities\": {\"blood_thinners\": \"aspirin\"}}\n"
-            f"Current data: {json.dumps(report)}\n"
-            "User message to analyze:"
-        )
+        nlu_instruction_text = "".join((
+            self.NLU_INSTRUCTIONS, "Current data: ", json.dumps(report), "\nUser message to analyze:"
+        ))
         
         # The prompt for NLU should send the system prompt, then conversation history for context, then the latest user message
         messages = [
@@ -69,6 +72,22 @@ class PromptGenerator:
         return messages
 
 
+    # --- Static text opening every agent response system prompt ---
+    AGENT_CONTEXT_HEADER = BASE_SYSTEM_PROMPT + "\n**Current Context for Agent's Next Response:**\n"
+
+    # --- Static instructions closing every agent response system prompt ---
+    AGENT_RESPONSE_INSTRUCTIONS = (
+        "**Instructions for Next Agent Response:**\n"
+        "Generate a natural, empathetic response that:\n"
+        "1. FIRST: Directly address what the patient just said - if they ask for help/suggestions, provide it\n"
+        "2. Shows understanding and empathy for their situation\n"
+        "3. If they ask questions or need help, answer that BEFORE moving to the next assessment topic\n"
+        "4. Only move to next assessment question if their immediate needs are addressed\n"
+        "5. Keep responses helpful but professional (max 80 tokens if providing suggestions)\n"
+        "6. Be responsive to their requests - don't ignore what they're asking for\n"
+        "Always prioritize being helpful over following a rigid script.\n"
+    )
+
     # --- LLM for Question Generation / Conversational Response ---
     def generate_agent_response_prompt(self, conversation_history: list, current_stage: str, patient_name: str, surgery_date: str, report: dict) -> list:
         """
@@ -93,21 +112,12 @@ class PromptGenerator:
 
         # Build the initial system prompt text (as a string)
         system_prompt_text = (
-            f"{self.BASE_SYSTEM_PROMPT}\n" # Include base persona
-                "**Current Context for Agent's Next Response:**\n"
+            f"{self.AGENT_CONTEXT_HEADER}" # Base persona + context heading
                 f"- Patient Name: {patient_name}\n"
                 f"- Surgery Date: {surgery_date}\n"
                 f"- Call Stage: {current_stage}\n"
             f"- Extracted report so far: {json.dumps(report)}\n"
-                "**Instructions for Next Agent Response:**\n"
-            "Generate a natural, empathetic response that:\n"
-            "1. FIRST: Directly address what the patient just said - if they ask for help/suggestions, provide it\n"
-            "2. Shows understanding and empathy for their situation\n"
-            "3. If they ask questions or need help, answer that BEFORE moving to the next assessment topic\n"
-            "4. Only move to next assessment question if their immediate needs are addressed\n"
-            "5. Keep responses helpful but professional (max 80 tokens if providing suggestions)\n"
-            "6. Be responsive to their requests - don't ignore what they're asking for\n"
-            "Always prioritize being helpful over following a rigid script.\n"
+            f"{self.AGENT_RESPONSE_INSTRUCTIONS}"
         )
         
         # Start the messages list with the system prompt (as a user role for context)
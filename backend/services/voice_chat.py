@@ -2,7 +2,7 @@ import os
 import logging
 from config import settings
 
-import google.generativeai as genai
+from . import genai_pool
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +16,11 @@ class TKAVoiceChat:
             raise ValueError("GEMINI_API_KEY is not set. Please provide a valid API key.")
 
         try:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel("gemini-2.5-flash")
+            genai_pool.configure(api_key)
+            self.model = genai_pool.get_model("gemini-2.5-flash")
             logger.info("TKA Voice Chat initialized with Gemini")
         except Exception as e:
-            logger.error(f"Failed to initialize Gemini model: {e}")
+            logger.error("Failed to initialize Gemini model: %s", e)
             raise
 
     def generate_response(self, prompt):
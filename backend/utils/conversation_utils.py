@@ -3,8 +3,31 @@ Conversation Utilities
 Helper functions for conversation analysis and area detection
 """
 
+import re
 from typing import Dict, List, Any
 
+
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one alternation matching any of them as a substring
+    (same semantics as `any(word in text for word in keywords)`, one C-level scan)"""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Preparation call areas in detection order: equipment/supplies first since its
+# keywords are more specific than the home safety ones
+_PREP_AREA_PATTERNS = (
+    ("equipment_supplies", _keyword_pattern(["equipment", "supplies", "toilet seat", "grabber", "walker", "crutches", "mobility", "aids", "shower chair", "bath bench", "raised toilet", "grabber tool", "useful tools", "helpful tools", "useful items", "helpful items", "grab bars", "non-slip", "non slip", "mats", "strips", "handrails", "secure"])),
+    ("home_safety", _keyword_pattern(["home", "safety", "trip", "hazard", "pathway", "lighting", "rug", "obstacle", "space", "recovery space", "clutter", "clear", "walking areas", "well-lit", "well lit"])),
+    ("medical_preparation", _keyword_pattern(["medication", "blood", "thinning", "aspirin", "warfarin", "eliquis", "medical", "clearance", "appointment"])),
+    ("support_verification", _keyword_pattern(["support", "help", "caregiver", "family", "friend", "someone", "assist", "partner", "spouse", "who will help"])),
+)
+
+# Bare replies that count as an answer even though they are a single word
+_SHORT_ANSWERS = frozenset({"yes", "no", "y", "n"})
+
+_FEELING_RE = _keyword_pattern(["anxious", "nervous", "worried", "scared", "excited", "concerned", "feeling", "fine", "good", "bad"])
+_SUPPORT_RE = _keyword_pattern(["husband", "wife", "friend", "family", "yes", "daughter", "son", "partner", "spouse", "right", "correct", "yep", "sure"])
+
 def get_covered_areas(history: List[Dict[str, str]], call_type: str = "initial_clinical_assessment") -> Dict[str, Any]:
     """
     Check which conversation areas have been covered based on call type
@@ -32,30 +55,18 @@ def get_covered_areas(history: List[Dict[str, str]], call_type: str = "initial_c
             
             # Track assistant questions per area
             if role == "assistant":
-                # Detect which area the question is about
-                # Check equipment/supplies first (more specific keywords)
-                equipment_keywords = ["equipment", "supplies", "toilet seat", "grabber", "walker", "crutches", "mobility", "aids", "shower chair", "bath bench", "raised toilet", "grabber tool", "useful tools", "helpful tools", "useful items", "helpful items", "grab bars", "non-slip", "non slip", "mats", "strips", "handrails", "secure"]
-                home_safety_keywords = ["home", "safety", "trip", "hazard", "pathway", "lighting", "rug", "obstacle", "space", "recovery space", "clutter", "clear", "walking areas", "well-lit", "well lit"]
-                
-                # Check equipment/supplies first (more specific keywords)
-                if any(word in content for word in equipment_keywords):
-                    current_area = "equipment_supplies"
-                    covered["equipment_supplies"]["questions_asked"] += 1
-                elif any(word in content for word in home_safety_keywords):
-                    current_area = "home_safety"
-                    covered["home_safety"]["questions_asked"] += 1
-                elif any(word in content for word in ["medication", "blood", "thinning", "aspirin", "warfarin", "eliquis", "medical", "clearance", "appointment"]):
-                    current_area = "medical_preparation"
-                    covered["medical_preparation"]["questions_asked"] += 1
-                elif any(word in content for word in ["support", "help", "caregiver", "family", "friend", "someone", "assist", "partner", "spouse", "who will help"]):
-                    current_area = "support_verification"
-                    covered["support_verification"]["questions_asked"] += 1
+                # Detect which area the question is about; first matching area wins
+                for area, pattern in _PREP_AREA_PATTERNS:
+                    if pattern.search(content):
+                        current_area = area
+                        covered[area]["questions_asked"] += 1
+                        break
             
             # Track user answers for current area
             elif role == "user" and current_area:
                 # Check if this is a valid answer (yes, no, or substantive response)
                 content_lower = content.lower().strip()
-                if (content_lower in ["yes", "no", "y", "n"] or 
+                if (content_lower in _SHORT_ANSWERS or 
                     len(content.split()) > 2):  # More than just yes/no
                     covered[current_area]["questions_answered"] += 1
                     
@@ -89,8 +100,7 @@ def get_covered_areas(history: List[Dict[str, str]], call_type: str = "initial_c
             if "yes" in user_text or "right" in user_text or "correct" in user_text:
                 coverage["surgery_date_confirmation"] = True
 
-        feeling_keywords = ["anxious", "nervous", "worried", "scared", "excited", "concerned", "feeling", "fine", "good", "bad"]
-        if "how are you feeling" in assistant_text and any(keyword in user_text for keyword in feeling_keywords):
+        if "how are you feeling" in assistant_text and _FEELING_RE.search(user_text):
             coverage["feelings_assessment"] = True
 
         if "on a scale of 1 to 10" in assistant_text and "pain" in assistant_text:
@@ -102,9 +112,8 @@ def get_covered_areas(history: List[Dict[str, str]], call_type: str = "initial_c
             if len(user_text.split()) > 2 and "nothing" not in user_text:
                 coverage["activity_limitations"] = True
         
-        support_keywords = ["husband", "wife", "friend", "family", "yes", "daughter", "son", "partner", "spouse", "right", "correct", "yep", "sure"]
         if "someone to help" in assistant_text or "who can help" in assistant_text:
-            if any(keyword in user_text for keyword in support_keywords):
+            if _SUPPORT_RE.search(user_text):
                 coverage["support_system"] = True
     
     return coverage 
\ No newline at end of file
@@ -0,0 +1,40 @@
+import datetime
+
+import pytest
+
+from backend.services.orchestrator import ConversationOrchestrator
+
+
+class FakeLLMClient:
+    """Stands in for LLMClient: replays queued NLU replies and counts the NLU calls."""
+
+    def __init__(self):
+        self.nlu_replies = []
+        self.nlu_calls = 0
+
+    def generate_response(self, prompt_parts: list, max_output_tokens: int = 250) -> str:
+        if max_output_tokens == 200: # NLU extraction
+            self.nlu_calls += 1
+            return self.nlu_replies.pop(0)
+        return "Agent reply"
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setenv("NLU_CACHE_ENABLED", "1")
+    orchestrator = ConversationOrchestrator()
+    orchestrator.llm_client = FakeLLMClient()
+    return orchestrator
+
+
+def take_turn(orchestrator, report: dict, history: list, user_message: str, call_type: str) -> dict:
+    """Runs one patient turn and returns get_next_agent_response's result."""
+    patient_data = {"first_name": "Ann", "surgery_date": None, "report": report}
+    call_session_data = {
+        "call_type": call_type,
+        "conversation_history": history,
+        "call_status": "in_progress",
+        "actual_call_start": datetime.datetime.now(),
+    }
+    return orchestrator.get_next_agent_response(patient_data, call_session_data, user_message)
@@ -0,0 +1,81 @@
+import threading
+from datetime import date, datetime, timedelta
+
+from backend.services import call_context_service
+from backend.services.call_context_service import CallContextService
+
+
+def _patient(**changes) -> dict:
+    patient = {
+        "id": "patient-1",
+        "first_name": "Ann",
+        "last_name": "Lee",
+        "surgery_date": datetime.now() + timedelta(days=21),
+        "primary_phone": "555-0100",
+        "overall_compliance_score": 0.5,
+        "surgery_readiness_status": "in_progress",
+    }
+    patient.update(changes)
+    return patient
+
+
+CALL_SESSION = {"id": "session-1", "call_type": "preparation", "days_from_surgery": -21}
+
+
+def test_context_is_reused_for_the_same_call():
+    service = CallContextService()
+    patient = _patient()
+    assert service.get_call_context(patient, CALL_SESSION) is service.get_call_context(dict(patient), CALL_SESSION)
+
+
+def test_edited_patient_gets_a_new_context():
+    service = CallContextService()
+    first = service.get_call_context(_patient(), CALL_SESSION)
+    moved = service.get_call_context(_patient(surgery_date=datetime.now() + timedelta(days=30)), CALL_SESSION)
+
+    assert moved is not first
+    assert moved.surgery_date_str != first.surgery_date_str
+
+
+def test_days_until_surgery_counts_from_the_cache_day(monkeypatch):
+    class FixedDate(date):
+        current = date(2025, 3, 1)
+
+        @classmethod
+        def today(cls):
+            return cls.current
+
+    monkeypatch.setattr(call_context_service, "date", FixedDate)
+    service = CallContextService()
+    patient = _patient(surgery_date=datetime(2025, 3, 22, 7, 30))
+
+    first = service.get_call_context(patient, CALL_SESSION)
+    FixedDate.current = date(2025, 3, 2)
+    next_day = service.get_call_context(patient, CALL_SESSION)
+
+    assert first.patient_data["days_until_surgery"] == 21
+    assert next_day.patient_data["days_until_surgery"] == 20
+
+
+def test_concurrent_lookups_share_the_cache():
+    service = CallContextService()
+    service.CONTEXT_CACHE_SIZE = 8
+    errors = []
+
+    def look_up(worker: int):
+        try:
+            for i in range(200):
+                session = dict(CALL_SESSION, id=f"session-{(worker + i) % 16}")
+                service.get_call_context(_patient(), session)
+                service.invalidate_call_context("patient-1", f"session-{i % 16}")
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=look_up, args=(worker,)) for worker in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(service._context_cache) <= service.CONTEXT_CACHE_SIZE
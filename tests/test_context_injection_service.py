@@ -0,0 +1,75 @@
+import dataclasses
+import json
+
+from backend.services.call_context_service import CallContext, CallType
+from backend.services.context_injection_service import ContextInjectionService
+
+
+def _context(call_type: CallType) -> CallContext:
+    return CallContext(
+        call_type=call_type,
+        days_from_surgery=-21,
+        patient_data={
+            "patient_id": "patient-1",
+            "name": "Ann",
+            "surgery_date": "2025-03-05",
+            "days_until_surgery": 21,
+        },
+        conversation_structure={},
+        focus_areas=["home_safety_check"],
+        escalation_triggers=["unsafe_home_environment"],
+        tone="supportive_practical",
+        estimated_duration_minutes=5,
+        surgery_date_str="March 05, 2025",
+    )
+
+
+def test_context_metadata_is_a_serializable_copy():
+    context = _context(CallType.PREPARATION)
+    metadata = ContextInjectionService().generate_llm_prompt(context)["context_metadata"]
+
+    assert json.loads(json.dumps(metadata))["patient_id"] == "patient-1"
+    metadata["focus_areas"].append("extra")
+    assert context.focus_areas == ["home_safety_check"]
+
+
+def test_system_prompt_is_static_block_then_patient_block():
+    service = ContextInjectionService()
+    first = service.generate_llm_prompt(_context(CallType.PREPARATION))["system_prompt"]
+    other = _context(CallType.PREPARATION)
+    other.patient_data["name"] = "Bob"
+    second = service.generate_llm_prompt(other)["system_prompt"]
+
+    static_prefix, patient_block = first.split("--- PATIENT CONTEXT ---")
+    assert second.startswith(static_prefix)
+    assert "Ann" in patient_block and "Ann" not in static_prefix
+
+
+def test_continuation_prompts_keep_their_own_wording():
+    service = ContextInjectionService()
+    prep = service.generate_llm_prompt(_context(CallType.PREPARATION), is_initial_call=False)["user_prompt"]
+    ica = service.generate_llm_prompt(_context(CallType.INITIAL_CLINICAL_ASSESSMENT), is_initial_call=False)["user_prompt"]
+
+    assert prep.startswith("Continue the preparation assessment conversation with Ann.\n\nCRITICAL INSTRUCTIONS:")
+    assert "- ONE question only - be conversational" in prep
+    assert ica.startswith("Continue the clinical assessment conversation with Ann.\n\nCRITICAL INSTRUCTIONS:")
+    assert "- ONE question at a time - be conversational" in ica
+    assert ica.endswith("Continue with the appropriate next step based on conversation history.")
+
+
+def test_scripts_are_filled_in_inside_the_patient_block():
+    service = ContextInjectionService()
+    other = dataclasses.replace(_context(CallType.INITIAL_CLINICAL_ASSESSMENT), surgery_date_str="April 01, 2025")
+    other.patient_data["name"] = "Bob"
+
+    for is_initial_call in (True, False):
+        first = service.generate_llm_prompt(_context(CallType.INITIAL_CLINICAL_ASSESSMENT), is_initial_call)["system_prompt"]
+        second = service.generate_llm_prompt(other, is_initial_call)["system_prompt"]
+
+        static_prefix, patient_block = first.split("--- PATIENT CONTEXT ---")
+        assert second.startswith(static_prefix)
+        assert "[PATIENT NAME]" not in first and "[SURGERY DATE]" not in first
+        assert 'WRAP-UP SCRIPT: "Thank you so much, Ann. I have all the information' in patient_block
+
+    initial = service.generate_llm_prompt(_context(CallType.INITIAL_CLINICAL_ASSESSMENT))["system_prompt"]
+    assert 'DATE CONFIRMATION QUESTION: "I have your surgery scheduled for March 05, 2025. Is that correct?"' in initial
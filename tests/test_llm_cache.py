@@ -0,0 +1,26 @@
+from backend.services.llm_cache import ExactLRU, nlu_cache_key
+
+
+def test_nlu_cache_key_folds_case_and_whitespace():
+    assert nlu_cache_key("Not  really", "PainAssessment", "initial_assessment") == \
+        nlu_cache_key(" not really ", "PainAssessment", "initial_assessment")
+
+
+def test_nlu_cache_key_depends_on_question_and_call_data():
+    question = "Do you take any blood thinners?"
+    call_data = {"blood_thinning_medications": ["none"]}
+    key = nlu_cache_key("None", "MedicationReview", "preparation", question, call_data)
+    assert key == nlu_cache_key("None", "MedicationReview", "preparation", question, dict(call_data))
+    assert key != nlu_cache_key("None", "MedicationReview", "preparation", question, {})
+    assert key != nlu_cache_key("None", "MedicationReview", "preparation", "Any allergies?", call_data)
+    assert key != nlu_cache_key("None", "MedicationReview", "initial_assessment", question, call_data)
+
+
+def test_exact_lru_evicts_least_recently_used():
+    cache = ExactLRU(maxsize=2)
+    cache.put(b"a", "1")
+    cache.put(b"b", "2")
+    assert cache.get(b"a") == "1"
+    cache.put(b"c", "3")
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == "1"
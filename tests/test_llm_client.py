@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+from backend.services.llm_client import LLMClient
+
+
+def _response(text: str) -> SimpleNamespace:
+    """A generate_content result with one candidate holding text."""
+    part = SimpleNamespace(text=text)
+    return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt_parts, generation_config=None):
+        self.calls += 1
+        return _response("Hello Ann")
+
+
+def _client(monkeypatch) -> LLMClient:
+    monkeypatch.setenv("LLM_CACHE_ENABLED", "1")
+    client = LLMClient("test-key")
+    client.model = FakeModel()
+    return client
+
+
+def test_repeated_prompt_is_served_from_cache(monkeypatch):
+    client = _client(monkeypatch)
+    prompt = [{"role": "user", "parts": [{"text": "hello"}]}]
+
+    assert client.generate_response(prompt) == "Hello Ann"
+    assert client.generate_response(prompt) == "Hello Ann"
+    assert client.model.calls == 1
+
+
+def test_prompt_that_cannot_be_keyed_is_sent_uncached(monkeypatch):
+    client = _client(monkeypatch)
+    prompt = [{"role": "user", "parts": [object()]}]
+
+    assert client.generate_response(prompt) == "Hello Ann"
+    assert client.generate_response(prompt) == "Hello Ann"
+    assert client.model.calls == 2
@@ -0,0 +1,269 @@
+import json
+
+import pytest
+
+from tests.conftest import take_turn
+
+
+def _medication_review_report() -> dict:
+    """A preparation call report with every area before MedicationReview answered."""
+    return {
+        "preparation_call": {
+            "ready_confirmed": True,
+            "recovery_space_prepared": True,
+            "trip_hazards_removed": True,
+            "assistive_tools_list": ["walker"],
+        }
+    }
+
+
+def _nlu_reply(**entities) -> str:
+    return json.dumps({"intent": "medication_response", "entities": entities})
+
+
+# --- NLU cache ---
+
+def test_repeated_none_answers_each_medication_question(orchestrator):
+    orchestrator.llm_client.nlu_replies = [
+        _nlu_reply(blood_thinners="none"),
+        _nlu_reply(allergies="none"),
+        _nlu_reply(medical_conditions="none"),
+    ]
+    report = _medication_review_report()
+    history = [{"role": "assistant", "content": "Do you take any blood thinners?"}]
+
+    for _ in range(3):
+        result = take_turn(orchestrator, report, history, "None", "preparation")
+        report, history = result["updated_clinical_data"], result["updated_conversation_history"]
+
+    prep_data = report["preparation_call"]
+    assert prep_data["blood_thinning_medications"] == ["none"]
+    assert prep_data["allergies_list"] == ["none"]
+    assert prep_data["medical_conditions_list"] == ["none"]
+    assert result["current_stage"] == "Closing"
+    assert orchestrator.llm_client.nlu_calls == 3
+
+
+def test_nlu_cache_reused_for_same_question(orchestrator):
+    orchestrator.llm_client.nlu_replies = [_nlu_reply(blood_thinners="none")]
+    history = [{"role": "assistant", "content": "Do you take any blood thinners?"}]
+
+    first = take_turn(orchestrator, _medication_review_report(), list(history), "None", "preparation")
+    second = take_turn(orchestrator, _medication_review_report(), list(history), "  none ", "preparation")
+
+    assert orchestrator.llm_client.nlu_calls == 1
+    assert first["updated_clinical_data"] == second["updated_clinical_data"]
+
+
+def test_nlu_cache_not_shared_across_questions(orchestrator):
+    orchestrator.llm_client.nlu_replies = [_nlu_reply(blood_thinners=["aspirin"]), _nlu_reply(allergies=["penicillin"])]
+    thinners = [{"role": "assistant", "content": "Which blood thinner do you take?"}]
+    allergies = [{"role": "assistant", "content": "Which medicine are you allergic to?"}]
+
+    take_turn(orchestrator, _medication_review_report(), thinners, "just the one", "preparation")
+    result = take_turn(orchestrator, _medication_review_report(), allergies, "just the one", "preparation")
+
+    assert orchestrator.llm_client.nlu_calls == 2
+    assert result["updated_clinical_data"]["preparation_call"]["allergies_list"] == ["penicillin"]
+
+
+def test_nlu_parse_failure_is_not_cached(orchestrator):
+    orchestrator.llm_client.nlu_replies = ["not json", _nlu_reply(blood_thinners="none")]
+    history = [{"role": "assistant", "content": "Do you take any blood thinners?"}]
+
+    take_turn(orchestrator, _medication_review_report(), list(history), "None", "preparation")
+    result = take_turn(orchestrator, _medication_review_report(), list(history), "None", "preparation")
+
+    assert orchestrator.llm_client.nlu_calls == 2
+    assert result["updated_clinical_data"]["preparation_call"]["blood_thinning_medications"] == ["none"]
+
+
+# --- Rule-based NLU short-circuit ---
+
+def _is_confident(orchestrator, message: str, stage: str, call_type: str = "initial_assessment", report: dict = None) -> bool:
+    rule_nlu = orchestrator._fallback_nlu(message, report or {}, call_type, stage)
+    return orchestrator._is_confident_rule_nlu(rule_nlu, message, stage)
+
+
+def test_short_answers_expected_at_the_stage_skip_the_llm(orchestrator):
+    assert _is_confident(orchestrator, "Yes", "InitialConfirmation")
+    assert _is_confident(orchestrator, "No", "SurgeryDateConfirmation")
+    assert _is_confident(orchestrator, "about 7", "PainAssessment")
+    assert _is_confident(orchestrator, "my wife", "SupportSystemAssessment")
+    assert _is_confident(orchestrator, "No", "MedicationReview", "preparation")
+
+
+def test_yes_no_with_a_second_answer_is_ambiguous(orchestrator):
+    for stage in ("SurgeryDateConfirmation", "PainAssessment", "SupportSystemAssessment"):
+        for message in ("Yes, it's 7", "Yeah, about 7", "sure, 9", "ok, my wife", "right knee, 8"):
+            assert not _is_confident(orchestrator, message, stage), (message, stage)
+
+
+def test_yes_no_with_other_words_is_ambiguous(orchestrator):
+    for message in ("Yes, aspirin", "yes taking aspirin", "Yes, warfarin", "yes I'm allergic"):
+        assert not _is_confident(orchestrator, message, "MedicationReview", "preparation"), message
+    for message in ("yes that's wrong", "Yeah, no."):
+        assert not _is_confident(orchestrator, message, "SurgeryDateConfirmation"), message
+    assert _is_confident(orchestrator, "Yes, correct", "SurgeryDateConfirmation")
+    assert _is_confident(orchestrator, "No, wrong", "SurgeryDateConfirmation")
+
+
+def test_yes_with_a_blood_thinner_goes_to_the_llm(orchestrator):
+    orchestrator.llm_client.nlu_replies = [_nlu_reply(blood_thinners=["aspirin"])]
+    history = [{"role": "assistant", "content": "Do you take any blood thinners?"}]
+
+    result = take_turn(orchestrator, _medication_review_report(), history, "Yes, aspirin", "preparation")
+
+    assert orchestrator.llm_client.nlu_calls == 1
+    assert result["updated_clinical_data"]["preparation_call"]["blood_thinning_medications"] == ["aspirin"]
+
+
+def test_yes_that_is_wrong_does_not_confirm_the_surgery_date(orchestrator):
+    orchestrator.llm_client.nlu_replies = [json.dumps({"intent": "confirm_no", "entities": {"confirmation": "no"}})]
+    report = {"initial_assessment_call": {"ready_confirmed": True}}
+    history = [{"role": "assistant", "content": "Is your surgery still on the 3rd?"}]
+
+    result = take_turn(orchestrator, report, history, "yes that's wrong", "initial_assessment")
+
+    assert orchestrator.llm_client.nlu_calls == 1
+    assert not result["updated_clinical_data"]["initial_assessment_call"].get("surgery_date_confirmed")
+
+
+def test_rule_intents_are_only_trusted_at_their_stage(orchestrator):
+    assert not _is_confident(orchestrator, "My right knee", "PainAssessment")
+    assert not _is_confident(orchestrator, "I have 2", "MedicationReview", "preparation")
+    assert not _is_confident(orchestrator, "my wife", "PainAssessment")
+    assert not _is_confident(orchestrator, "Not sure", "InitialConfirmation")
+
+
+def test_fallback_reads_pain_level_from_initial_assessment_call(orchestrator):
+    report = {"initial_assessment_call": {"pain_level": 5}}
+    assert orchestrator._fallback_nlu("2", report, "initial_assessment")["intent"] != "report_pain"
+    assert orchestrator._fallback_nlu("2", {}, "initial_assessment") == \
+        {"intent": "report_pain", "entities": {"pain_level": 2}}
+
+
+def test_yes_with_pain_level_goes_to_the_llm(orchestrator):
+    orchestrator.llm_client.nlu_replies = [json.dumps({"intent": "report_pain", "entities": {"pain_level": 7}})]
+    report = {"initial_assessment_call": {"ready_confirmed": True, "surgery_date_confirmed": True}}
+    history = [{"role": "assistant", "content": "How bad is the pain, from 0 to 10?"}]
+
+    result = take_turn(orchestrator, report, history, "Yes, it's 7", "initial_assessment")
+
+    assert orchestrator.llm_client.nlu_calls == 1
+    assert result["updated_clinical_data"]["initial_assessment_call"]["pain_level"] == 7
+
+
+def test_confident_rule_answer_makes_no_llm_call(orchestrator):
+    history = [{"role": "assistant", "content": "Are you ready to begin?"}]
+
+    result = take_turn(orchestrator, {}, history, "Yes", "initial_assessment")
+
+    assert orchestrator.llm_client.nlu_calls == 0
+    assert result["updated_clinical_data"]["initial_assessment_call"]["ready_confirmed"] is True
+
+
+# --- Rule-based keyword matching ---
+
+def test_keywords_match_whole_words_only(orchestrator):
+    assert orchestrator._fallback_nlu("my son", {})["entities"] == {"helper": "son"}
+    for message in ("a person", "the reason is", "I know"):
+        assert orchestrator._fallback_nlu(message, {})["intent"] == "unknown", message
+    heartburn = orchestrator._fallback_nlu("heartburn", {}, "preparation", "MedicationReview")
+    assert heartburn["entities"] != {"medical_conditions": "heart condition"}
+
+
+def test_plural_keywords_match_their_singular(orchestrator):
+    assert orchestrator._fallback_nlu("I removed the rugs", {}, "preparation", "HomeSafetyAssessment") == \
+        {"intent": "home_safety_response", "entities": {"trip_hazards": "removed"}}
+
+
+def test_equipment_and_medication_rules_only_apply_at_their_stage(orchestrator):
+    for message in ("none", "nothing", "not yet", "I have the walker", "I take aspirin"):
+        intent = orchestrator._fallback_nlu(message, {}, "initial_assessment", "PainAssessment")["intent"]
+        assert intent not in ("equipment_response", "medication_response"), message
+
+    assert orchestrator._fallback_nlu("I have diabetes", {}, "preparation", "MedicationReview") == \
+        {"intent": "medication_response", "entities": {"medical_conditions": "diabetes"}}
+    assert orchestrator._fallback_nlu("nothing", {}, "preparation", "MedicationReview") == \
+        {"intent": "medication_response", "entities": {"blood_thinners": "none"}}
+    assert orchestrator._fallback_nlu("not yet", {}, "preparation", "MedicalEquipmentAssessment") == \
+        {"intent": "equipment_response", "entities": {"toilet_seat": "needed"}}
+    assert orchestrator._fallback_nlu("I have the walker", {}, "preparation", "MedicalEquipmentAssessment") == \
+        {"intent": "equipment_response", "entities": {"walker": "obtained"}}
+
+
+# --- Assessment area completion ---
+
+def test_medication_review_needs_all_three_answers(orchestrator):
+    def complete(**prep_data):
+        report = {"preparation_call": prep_data}
+        return orchestrator._is_area_complete_by_call_type(report, "MedicationReview", "preparation")
+
+    assert not complete(medical_conditions_list=["diabetes"])
+    assert not complete(allergies_list=["none"], medical_conditions_list=["none"])
+    assert not complete(blood_thinning_medications=["aspirin"], allergies_list=["none"], medical_conditions_list=[])
+    assert complete(blood_thinning_medications=["aspirin"], allergies_list=["none"], medical_conditions_list=["none"])
+
+
+def test_other_areas_treat_only_missing_none_empty_as_unanswered(orchestrator):
+    def complete(area: str, **initial_data):
+        report = {"initial_assessment_call": initial_data}
+        return orchestrator._is_area_complete_by_call_type(report, area, "initial_assessment")
+
+    assert complete("PainAssessment", pain_level=0)
+    assert not complete("PainAssessment")
+    assert not complete("PainAssessment", pain_level=None)
+    assert not complete("MobilityAssessment", difficult_activities_pain="")
+    assert not complete("SupportSystemAssessment", primary_helper_identified=[])
+
+
+# --- Report updates dispatched by intent ---
+
+_INITIAL_REPORT = {"initial_assessment_call": {"ready_confirmed": True, "surgery_date_confirmed": True}}
+_HOME_SAFETY_REPORT = {"preparation_call": {"ready_confirmed": True}}
+_EQUIPMENT_REPORT = {"preparation_call": {"ready_confirmed": True, "recovery_space_prepared": True, "trip_hazards_removed": True}}
+_MEDICATION_REPORT = {"preparation_call": dict(_EQUIPMENT_REPORT["preparation_call"], assistive_tools_list=["walker"])}
+
+
+@pytest.mark.parametrize("report, call_type, intent, entities, expected", [
+    (_INITIAL_REPORT, "initial_assessment", "report_pain", {"pain_level": 8},
+     {"pain_level": 8, "high_pain_alert": True}),
+    (_INITIAL_REPORT, "initial_assessment", "report_pain", {"pain_level": "x"}, {}),
+    (_INITIAL_REPORT, "initial_assessment", "report_pain", {}, {}),
+    (_INITIAL_REPORT, "initial_assessment", "difficult_activities", {"activities": ["stairs", "kneeling"]},
+     {"difficult_activities_pain": "stairs, kneeling"}),
+    (_INITIAL_REPORT, "initial_assessment", "difficult_activities", {"activity": "walking", "activities": "stairs"},
+     {"difficult_activities_pain": "walking"}),
+    (_INITIAL_REPORT, "initial_assessment", "identify_helper", {"helper_relationship": "son", "helper": "wife"},
+     {"primary_helper_identified": "son"}),
+    (_HOME_SAFETY_REPORT, "preparation", "home_safety_response", {"recovery_space": "prepared", "trip_hazards": "discussed"},
+     {"recovery_space_prepared": True, "trip_hazards_removed": False}),
+    (_EQUIPMENT_REPORT, "preparation", "equipment_response", {"toilet_seat": "obtained", "walker": "needed", "shower_chair": "obtained"},
+     {"assistive_tools_list": ["raised toilet seat", "shower chair"]}),
+    (_MEDICATION_REPORT, "preparation", "medication_response", {"allergies": "latex"},
+     {"blood_thinning_medications": [], "medical_conditions_list": [], "allergies_list": ["latex"]}),
+    (_MEDICATION_REPORT, "preparation", "medication_response", {"blood_thinners": ["aspirin"], "allergies": "latex"},
+     {"blood_thinning_medications": ["aspirin"], "medical_conditions_list": [], "allergies_list": []}),
+    (_MEDICATION_REPORT, "preparation", "medication_response", {},
+     {"blood_thinning_medications": [], "medical_conditions_list": [], "allergies_list": []}),
+    (_HOME_SAFETY_REPORT, "preparation", "confirm_yes", {},
+     {"recovery_space_prepared": True}),
+    (_HOME_SAFETY_REPORT, "preparation", "confirm_no", {}, {}),
+    (_EQUIPMENT_REPORT, "preparation", "confirm_yes", {},
+     {"assistive_tools_list": ["raised toilet seat", "grabber tool"]}),
+    (_MEDICATION_REPORT, "preparation", "confirm_no", {},
+     {"blood_thinning_medications": ["none"], "medical_conditions_list": [], "allergies_list": []}),
+    (_MEDICATION_REPORT, "preparation", "unknown", {}, {}),
+])
+def test_intents_update_the_report(orchestrator, report, call_type, intent, entities, expected):
+    orchestrator.llm_client.nlu_replies = [json.dumps({"intent": intent, "entities": entities})]
+    report = json.loads(json.dumps(report))
+    section = "preparation_call" if call_type == "preparation" else "initial_assessment_call"
+    before = dict(report[section])
+    history = [{"role": "assistant", "content": "Next question"}]
+
+    result = take_turn(orchestrator, report, history, "hmm", call_type)
+
+    assert orchestrator.llm_client.nlu_calls == 1
+    assert result["updated_clinical_data"][section] == dict(before, **expected)